@@ -7,7 +7,7 @@ import traceback
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
 from core.entities import Player, Enemy, Stats
 from core import progression, save as save_module
@@ -23,9 +23,28 @@ from ui.main_window import MainWindow
 
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
-SAVE_PATH = BASE_DIR / "save" / "progress.json"
+SAVE_PATH = BASE_DIR / "save" / "progress.bin"
+SAVE_DEBOUNCE_MS = 500
 GITHUB_RAW_BASE = os.getenv("GITHUB_RAW_BASE_URL", "https://raw.githubusercontent.com/user/repo/main/")
 
+# 앱 전역 스타일시트 (고정 문자열이므로 모듈 로드 시 한 번만 만든다)
+APP_STYLESHEET = """
+    QWidget { background-color: #0f1b2c; color: #e8f1ff; font-family: 'Segoe UI', 'Noto Sans KR', 'Malgun Gothic'; }
+    QPushButton { background-color: #1f3552; border: 1px solid #3a5c8a; padding: 10px 14px; border-radius: 6px; color: #e8f1ff; }
+    QPushButton:hover { background-color: #2a4670; }
+    QPushButton:disabled { background-color: #1a2636; color: #6b7b91; border-color: #24364c; }
+    QPushButton[locked="true"] { background-color: #141c28; color: #556070; border-color: #1f2b3b; }
+    QPushButton[locked="true"]:hover { background-color: #141c28; }
+    QGroupBox { border: 1px solid #24405f; border-radius: 8px; margin-top: 12px; padding: 8px; font-weight: bold; }
+    QGroupBox::title { subcontrol-origin: margin; left: 12px; padding: 0 4px; color: #8fb4ff; }
+    QLabel { font-size: 14px; }
+    QTextEdit { background-color: #0c1522; border: 1px solid #1e2d45; border-radius: 6px; }
+    QListWidget { background-color: #0c1522; border: 1px solid #1e2d45; border-radius: 6px; }
+    QProgressBar { background-color: #0c1522; border: 1px solid #1e2d45; border-radius: 6px; text-align: center; }
+    QProgressBar::chunk { background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #49c6ff, stop:1 #3fa5ff); border-radius: 6px; }
+    QScrollArea { border: none; }
+"""
+
 
 class GameController:
     """데이터/전투/저장 로직을 묶는 컨트롤러."""
@@ -40,9 +59,15 @@ class GameController:
         print(f"[로드 요약] default_player_id={self.data_store.default_player_id}")
 
         self.data_items = self.data_store.items
+        # 소비 아이템 id는 로드 이후 바뀌지 않으므로 한 번만 모아 둔다.
+        self._consumable_ids: frozenset[str] = frozenset(
+            item_id for item_id, item in self.data_items.items() if item.get("type") == "consumable"
+        )
         self.data_drop_tables = self.data_store.drop_tables
         self.data_dungeons = self._load_json(DATA_DIR / "dungeons.json")
-        self.data_bosses = self.data_store.bosses or {}
+        self._stage_index = self._build_stage_index(self.data_dungeons)
+        # 몬스터 선택 전용 난수 생성기 (전역 random 상태와 분리)
+        self._rng = random.Random()
 
         self.progress = save_module.load_progress(
             str(SAVE_PATH),
@@ -57,15 +82,47 @@ class GameController:
         self._load_player_state(self.selected_player_id)
 
         self.battle_engine = BattleEngine(self.data_store)
+        # 적 기본 스탯은 전투 중 변하지 않으므로 enemy_id별로 공유한다.
+        self._enemy_stats_cache: Dict[str, Stats] = {}
+        self._skill_pairs_key: Optional[tuple[str, ...]] = None
+        self._skill_pairs_cache: list[tuple[str, str]] = []
         self.current_battle = None
         self.last_zone_stage: Optional[tuple[str, int]] = None
         self.last_boss_type: Optional[str] = None
 
+        # 연속된 장비/스탯 변경은 한 번의 저장으로 묶는다.
+        self._dirty = False
+        self._save_timer = QtCore.QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.flush_save)
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_about_to_quit)
+
     # 데이터 로드/세이브
+    @property
+    def data_bosses(self) -> Dict[str, Any]:
+        """bosses.json 데이터 (DataStore가 첫 접근 시 로드)."""
+        return self.data_store.bosses
+
     def _load_json(self, path: Path) -> Dict[str, Any]:
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
+    def _build_stage_index(self, dungeons: Dict[str, Any]) -> Dict[tuple[str, int], Dict[str, Any]]:
+        """(zone, stage) -> 스테이지 데이터 평면 인덱스. monster_pool은 튜플로 고정."""
+        index: Dict[tuple[str, int], Dict[str, Any]] = {}
+        for zone_id, zone_data in (dungeons.get("zones", {}) or {}).items():
+            for stage_id, stage_data in (zone_data.get("stages", {}) or {}).items():
+                if not stage_data:
+                    continue
+                index[(zone_id, int(stage_id))] = {
+                    **stage_data,
+                    "monster_pool": tuple(stage_data.get("monster_pool", []) or ()),
+                }
+        return index
+
     def _build_player(self) -> Player:
         # 선택된 플레이어 상태를 기반으로 Player 객체 생성
         pdata = self.data_store.get_player(self.selected_player_id)
@@ -117,17 +174,16 @@ class GameController:
         self.selected_player_id = player_id
         self.player = self._build_player()
         entry = self.progress.get("players", {}).get(player_id, {})
-        dungeon_state = entry.get("dungeon_progress", {})
-        self.dungeon_progress = DungeonProgress(
-            unlocked_zones=dungeon_state.get("unlocked_zones", ["1"]),
-            unlocked_stage_by_zone=dungeon_state.get("unlocked_stage_by_zone", {"1": 1}),
-        )
+        self.dungeon_progress = DungeonProgress.from_raw(entry.get("dungeon_progress", {}))
         # 캐릭터 전환 시에는 체력을 최대치로 회복하여 이전 전투 피해가 남지 않도록 처리
         max_hp = self.player.get_total_stats(self.data_items).max_hp
         self.player.hp = max_hp
 
     def _store_player_state(self) -> None:
-        """현재 플레이어 상태를 progress에 반영."""
+        """현재 플레이어 상태를 progress에 반영.
+
+        저장은 호출 스레드에서 곧바로 직렬화하므로 복사 없이 현재 dict/list를 그대로 넣는다.
+        """
         entry = self.progress.setdefault("players", {}).setdefault(self.selected_player_id, {})
         entry["player_state"] = {
             "level": self.player.level,
@@ -137,17 +193,31 @@ class GameController:
             "allocated_stats": self.player.allocated_stats,
             "hp": self.player.hp,
         }
-        entry["inventory"] = dict(self.player.inventory)
-        entry["equipment"] = dict(self.player.equipment)
-        entry["dungeon_progress"] = {
-            "unlocked_zones": list(self.dungeon_progress.unlocked_zones),
-            "unlocked_stage_by_zone": dict(self.dungeon_progress.unlocked_stage_by_zone),
-        }
+        entry["inventory"] = self.player.inventory
+        entry["equipment"] = self.player.equipment
+        entry["dungeon_progress"] = self.dungeon_progress.to_dict()
         self.progress["selected_player_id"] = self.selected_player_id
 
     def save(self) -> None:
+        """즉시 저장. 대기 중인 지연 저장은 취소한다."""
+        self._save_timer.stop()
+        self._dirty = False
         self._store_player_state()
-        save_module.save_progress(str(SAVE_PATH), self.progress)
+        save_module.save_progress_async(str(SAVE_PATH), self.progress)
+
+    def _mark_dirty(self) -> None:
+        """변경 사항을 표시하고 SAVE_DEBOUNCE_MS 뒤에 한 번만 저장."""
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush_save(self) -> None:
+        """대기 중인 변경 사항이 있으면 바로 저장."""
+        if self._dirty:
+            self.save()
+
+    def _on_about_to_quit(self) -> None:
+        self.flush_save()
+        save_module.wait_for_pending_writes()
 
     # 요약/헬퍼
     def player_summary(self) -> str:
@@ -169,11 +239,18 @@ class GameController:
         )
 
     def skill_pairs(self):
-        return [(sid, self.data_store.skills.get(sid, {}).get("name", sid)) for sid in self.player.skills]
+        """(스킬 id, 이름) 목록. 스킬 구성이 같으면 이전 결과를 재사용한다."""
+        key = tuple(self.player.skills)
+        if key != self._skill_pairs_key:
+            skills = self.data_store.skills
+            self._skill_pairs_key = key
+            self._skill_pairs_cache = [(sid, skills.get(sid, {}).get("name", sid)) for sid in key]
+        return self._skill_pairs_cache
 
     def usable_consumables(self):
-        inv = items_util._ensure_inventory_dict(self.player)
-        return [item_id for item_id, cnt in inv.items() if cnt > 0 and self.data_items.get(item_id, {}).get("type") == "consumable"]
+        # Player.__post_init__에서 인벤토리는 항상 dict로 정규화된다.
+        consumable_ids = self._consumable_ids
+        return [item_id for item_id, cnt in self.player.inventory.items() if cnt > 0 and item_id in consumable_ids]
 
     def sync_player_hp(self) -> None:
         max_hp = self.player.get_total_stats(self.data_items).max_hp
@@ -181,8 +258,7 @@ class GameController:
 
     # 던전/전투 시작
     def start_stage(self, zone: str, stage: int):
-        stages = self.data_dungeons.get("zones", {}).get(zone, {}).get("stages", {})
-        stage_data = stages.get(str(stage))
+        stage_data = self._stage_index.get((zone, stage))
         if not stage_data:
             return None
         expected_exp = stage_data.get("exp", 0)
@@ -194,17 +270,17 @@ class GameController:
                 drop_table = boss_data.get("drop_table") if boss_data else None
                 enemy = self._build_enemy(boss_id or "unknown_boss", boss_data, is_boss=True, drop_table=drop_table)
             else:
-                pool = stage_data.get("monster_pool", [])
+                pool = stage_data["monster_pool"]
                 if not pool:
                     return None
-                monster_id = random.choice(pool)
+                monster_id = self._rng.choice(pool)
                 monster_data = self.data_store.monsters.get(monster_id, {})
                 enemy = self._build_enemy(monster_id, monster_data, is_boss=False)
         else:
-            pool = stage_data.get("monster_pool", [])
+            pool = stage_data["monster_pool"]
             if not pool:
                 return None
-            monster_id = random.choice(pool)
+            monster_id = self._rng.choice(pool)
             monster_data = self.data_store.monsters.get(monster_id, {})
             enemy = self._build_enemy(monster_id, monster_data, is_boss=False)
         state = self.battle_engine.start_battle(self.player, enemy, expected_exp=expected_exp, drop_table_id=drop_table or getattr(enemy, "drop_table", None))
@@ -225,20 +301,23 @@ class GameController:
         return state
 
     def _build_enemy(self, enemy_id: str, data: Dict[str, Any], is_boss: bool, drop_table: Optional[str] = None) -> Enemy:
-        stats_dict = data.get("stats", {})
-        stats = Stats(
-            attack=stats_dict.get("attack", 0),
-            magic=stats_dict.get("magic", 0),
-            defense=stats_dict.get("defense", 0),
-            magic_resist=stats_dict.get("magic_resist", 0),
-            max_hp=stats_dict.get("max_hp", 1),
-        )
+        stats = self._enemy_stats_cache.get(enemy_id)
+        if stats is None:
+            stats_dict = data.get("stats", {})
+            stats = Stats(
+                attack=stats_dict.get("attack", 0),
+                magic=stats_dict.get("magic", 0),
+                defense=stats_dict.get("defense", 0),
+                magic_resist=stats_dict.get("magic_resist", 0),
+                max_hp=stats_dict.get("max_hp", 1),
+            )
+            self._enemy_stats_cache[enemy_id] = stats
         return Enemy(
             enemy_id=enemy_id,
             name=data.get("name", enemy_id),
             stats=stats,
             ai=data.get("ai", "basic"),
-            skills=data.get("skills", []),
+            skills=data.get("skills", ()),
             gimmicks=data.get("gimmicks", []),
             drop_table=drop_table or data.get("drop_table"),
             is_boss=is_boss,
@@ -281,16 +360,18 @@ class GameController:
         if not success:
             print(f"[장착 실패] {msg}")
             return
+        self.player.invalidate_stats()
         self.sync_player_hp()
-        self.save()
+        self._mark_dirty()
 
     def unequip(self, slot: str):
         success, msg = items_util.unequip_slot(self.player, slot, self.data_store)
         if not success:
             print(f"[해제 실패] {msg}")
             return
+        self.player.invalidate_stats()
         self.sync_player_hp()
-        self.save()
+        self._mark_dirty()
 
     def apply_stat_points(self, spend: Dict[str, int]):
         total = sum(spend.values())
@@ -301,8 +382,9 @@ class GameController:
             if value <= 0:
                 continue
             self.player.allocated_stats[key] = self.player.allocated_stats.get(key, 0) + value
+        self.player.invalidate_stats()
         self.sync_player_hp()
-        self.save()
+        self._mark_dirty()
 
     def switch_player(self, player_id: str):
         """현재 상태 저장 후 다른 캐릭터로 전환."""
@@ -368,24 +450,7 @@ def main():
     try:
         stage = "ui_init"
         app = QtWidgets.QApplication([])
-        app.setStyleSheet(
-            """
-            QWidget { background-color: #0f1b2c; color: #e8f1ff; font-family: 'Segoe UI', 'Noto Sans KR', 'Malgun Gothic'; }
-            QPushButton { background-color: #1f3552; border: 1px solid #3a5c8a; padding: 10px 14px; border-radius: 6px; color: #e8f1ff; }
-            QPushButton:hover { background-color: #2a4670; }
-            QPushButton:disabled { background-color: #1a2636; color: #6b7b91; border-color: #24364c; }
-            QPushButton[locked="true"] { background-color: #141c28; color: #556070; border-color: #1f2b3b; }
-            QPushButton[locked="true"]:hover { background-color: #141c28; }
-            QGroupBox { border: 1px solid #24405f; border-radius: 8px; margin-top: 12px; padding: 8px; font-weight: bold; }
-            QGroupBox::title { subcontrol-origin: margin; left: 12px; padding: 0 4px; color: #8fb4ff; }
-            QLabel { font-size: 14px; }
-            QTextEdit { background-color: #0c1522; border: 1px solid #1e2d45; border-radius: 6px; }
-            QListWidget { background-color: #0c1522; border: 1px solid #1e2d45; border-radius: 6px; }
-            QProgressBar { background-color: #0c1522; border: 1px solid #1e2d45; border-radius: 6px; text-align: center; }
-            QProgressBar::chunk { background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #49c6ff, stop:1 #3fa5ff); border-radius: 6px; }
-            QScrollArea { border: none; }
-            """
-        )
+        app.setStyleSheet(APP_STYLESHEET)
 
         # AutoPatcher는 GitHub Raw에서 manifest/파일을 내려받는다.
         patcher = AutoPatcher(GITHUB_RAW_BASE, BASE_DIR)
@@ -10,12 +10,25 @@ from PyQt6 import QtGui, QtCore
 class AssetLoader:
     """이미지 파일을 규칙 기반으로 탐색하고, 없으면 플레이스홀더를 제공하는 로더."""
 
+    _RE_SPACES = re.compile(r"\s+")
+    _RE_NONALNUM = re.compile(r"[^a-z0-9_]+")
+    _RE_UNDERSCORES = re.compile(r"_+")
+    # 원본 id -> 후보 id 튜플. 모든 로더 인스턴스가 공유한다.
+    _candidate_cache: Dict[str, Tuple[str, ...]] = {}
+    # assets 폴더 -> 파일 인덱스. 폴더마다 한 번만 훑고 모든 로더 인스턴스가 공유한다.
+    _fs_index_cache: Dict[Path, Dict[Tuple[str, str], list[Path]]] = {}
+    PIXMAP_CACHE_LIMIT_KB = 65536
+
     def __init__(self, base_dir: Optional[Path] = None) -> None:
         root = Path(base_dir) if base_dir else Path(__file__).resolve().parent.parent
         self.asset_dir = root / "assets"
         self.asset_dir.mkdir(exist_ok=True)
-        self._cache: Dict[Tuple[str, str, int, int], QtGui.QPixmap] = {}
+        # 픽스맵은 Qt 전역 QPixmapCache(용량 제한/LRU 내장)에 보관해 위젯 간에 공유한다.
+        QtGui.QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
         self._exts = [".png", ".webp", ".jpg", ".jpeg"]
+        self._fs_index = self._fs_index_cache.get(self.asset_dir)
+        if self._fs_index is None:
+            self._fs_index = self._fs_index_cache[self.asset_dir] = self._build_fs_index()
         self._icon_alias = {
             "buff_stats": "buff",
             "debuff_stats": "debuff",
@@ -79,12 +92,8 @@ class AssetLoader:
         # 중복 제거, 순서 유지
         seen = set()
         ids = [x for x in ids if not (x in seen or seen.add(x))]
-        base = self.asset_dir / "effects"
         for cid in ids:
-            for ext in self._exts:
-                path = base / f"{cid}{ext}"
-                if not path.exists():
-                    continue
+            for path in self._fs_index.get(("effects", cid), ()):
                 pix = QtGui.QPixmap(str(path))
                 if pix.isNull():
                     print(f"[경고] 스킬 이펙트 로드 실패: {path}")
@@ -96,45 +105,71 @@ class AssetLoader:
     # -------------------------------------------------------------
     # 내부 헬퍼
     # -------------------------------------------------------------
+    def _build_fs_index(self) -> Dict[Tuple[str, str], list[Path]]:
+        """assets 폴더를 한 번 훑어 (카테고리, 파일명) -> 경로 목록(확장자 우선순위 순) 인덱스 생성.
+
+        확장자는 대소문자를 구분하지 않는다. (Slime.PNG, bg.JPG 등)
+        """
+        index: Dict[Tuple[str, str], list[Path]] = {}
+        for path in self.asset_dir.rglob("*"):
+            if path.suffix.lower() not in self._exts or not path.is_file():
+                continue
+            category = path.parent.relative_to(self.asset_dir).as_posix()
+            index.setdefault((category, path.stem), []).append(path)
+        for paths in index.values():
+            paths.sort(key=lambda p: self._exts.index(p.suffix.lower()))
+        return index
+
     def _normalize(self, raw: str) -> str:
         text = (raw or "").strip()
         text = text.lower()
-        text = re.sub(r"\s+", "_", text)
-        text = re.sub(r"[^a-z0-9_]+", "_", text)
-        text = re.sub(r"_+", "_", text)
+        text = self._RE_SPACES.sub("_", text)
+        text = self._RE_NONALNUM.sub("_", text)
+        text = self._RE_UNDERSCORES.sub("_", text)
         return text.strip("_") or raw
 
     def _candidate_ids(self, raw: str) -> list[str]:
         primary = raw or ""
-        normalized = self._normalize(primary)
-        ids = [primary]
-        if normalized and normalized != primary:
-            ids.append(normalized)
-        return ids
+        cached = self._candidate_cache.get(primary)
+        if cached is None:
+            normalized = self._normalize(primary)
+            cached = (primary, normalized) if normalized and normalized != primary else (primary,)
+            self._candidate_cache[primary] = cached
+        # 호출부에서 후보를 덧붙이므로 매번 새 리스트로 돌려준다.
+        return list(cached)
 
     def _load_with_candidates(self, category: str, ids: list[str], fallback_text: str, size: QtCore.QSize) -> QtGui.QPixmap:
         key_base = (category, fallback_text, size.width(), size.height())
         for cid in ids:
             cache_key = (category, cid, size.width(), size.height())
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
             pix = self._try_load(category, cid, size)
             if pix:
-                self._cache[cache_key] = pix
+                self._cache_put(cache_key, pix)
                 return pix
         # 플레이스홀더 캐싱
-        if key_base in self._cache:
-            return self._cache[key_base]
+        cached = self._cache_get(key_base)
+        if cached is not None:
+            return cached
         placeholder = self._placeholder(size=size, text=fallback_text)
-        self._cache[key_base] = placeholder
+        self._cache_put(key_base, placeholder)
         return placeholder
 
+    def _cache_get(self, key: Tuple[str, str, int, int]) -> Optional[QtGui.QPixmap]:
+        return QtGui.QPixmapCache.find(self._cache_key(key))
+
+    def _cache_put(self, key: Tuple[str, str, int, int], pix: QtGui.QPixmap) -> None:
+        QtGui.QPixmapCache.insert(self._cache_key(key), pix)
+
+    @staticmethod
+    def _cache_key(key: Tuple[str, str, int, int]) -> str:
+        category, cid, w, h = key
+        return f"asset:{category}:{cid}:{w}x{h}"
+
     def _try_load(self, category: str, cid: str, size: QtCore.QSize) -> Optional[QtGui.QPixmap]:
-        base = self.asset_dir / category
-        for ext in self._exts:
-            path = base / f"{cid}{ext}"
-            if not path.exists():
-                continue
+        for path in self._fs_index.get((category, cid), ()):
             pix = QtGui.QPixmap(str(path))
             if pix.isNull():
                 print(f"[경고] 에셋 로드 실패: {path}")
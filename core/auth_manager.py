@@ -3,17 +3,20 @@ from __future__ import annotations
 """간단한 로그인 인증 관리자.
 
 - 현재는 하드코딩된 관리자 계정(ID: admin / PW: admin)만 허용합니다.
+- 계정 정보는 SHA-256 다이제스트로만 보관하고 hmac.compare_digest로 비교합니다.
 - 추후 DB 또는 API 연동 시 이 클래스를 확장하면 됩니다.
 """
 
+import hashlib
+import hmac
 from typing import Tuple
 
 
 class AuthManager:
     def __init__(self) -> None:
         # 나중에 DB 커넥션, 세션 토큰 등을 붙일 자리를 남겨둔다.
-        self._dummy_id = "admin"
-        self._dummy_pw = "admin"
+        self._dummy_id_hash = self._digest("admin")
+        self._dummy_pw_hash = self._digest("admin")
 
     def login(self, user_id: str, password: str) -> Tuple[bool, str]:
         """사용자 로그인 검증.
@@ -25,9 +28,16 @@ class AuthManager:
         Returns:
             (성공 여부, 메시지)
         """
-        if user_id == self._dummy_id and password == self._dummy_pw:
+        # 둘 다 비교해 어느 쪽이 틀렸는지 응답 시간으로 드러나지 않게 한다.
+        id_ok = hmac.compare_digest(self._digest(user_id), self._dummy_id_hash)
+        pw_ok = hmac.compare_digest(self._digest(password), self._dummy_pw_hash)
+        if id_ok & pw_ok:
             return True, "로그인 성공"
         return False, "아이디 또는 비밀번호가 올바르지 않습니다"
 
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
 
 __all__ = ["AuthManager"]
@@ -5,27 +5,35 @@ from __future__ import annotations
 - requests 기반으로 GitHub Raw URL을 사용해 최신 데이터를 내려받습니다.
 - 오프라인/에러 시 게임이 크래시하지 않도록 항상 실패를 감싸고 False를 반환합니다.
 - 임시 파일로 먼저 저장 후 교체하여 다운로드 중 파손을 방지합니다.
+- manifest는 ETag/Last-Modified 조건부 요청으로 받아, 변경이 없으면(304) 본문 없이 캐시를 씁니다.
+- manifest 항목은 버전 문자열 또는 {"v": 버전, "sha256": 해시} 형식이며,
+  해시가 있으면 로컬 파일과 같을 때 다운로드를 건너뜁니다.
 """
 
+import hashlib
 import json
 import logging
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 log = logging.getLogger(__name__)
 
 
 class AutoPatcher:
-    def __init__(self, base_url: str, local_root: Path, timeout: float = 10.0) -> None:
+    def __init__(self, base_url: str, local_root: Path, timeout: float = 10.0, max_workers: int = 8) -> None:
         """GitHub Raw 베이스 URL과 로컬 루트 경로를 지정합니다.
 
         Args:
             base_url: 예) "https://raw.githubusercontent.com/user/repo/main/" (끝에 / 있으면 그대로 사용)
             local_root: 데이터/에셋이 저장될 로컬 기본 폴더(Path 객체 권장)
             timeout: 요청 타임아웃(초)
+            max_workers: 동시에 내려받을 최대 파일 수
         """
         if not base_url.endswith("/"):
             base_url += "/"
@@ -33,7 +41,14 @@ class AutoPatcher:
         self.local_root = Path(local_root)
         self.timeout = timeout
         self.manifest_name = "manifest.json"
+        # 서버 manifest 본문과 검증자(ETag/Last-Modified)를 보관하는 사이드카 파일
+        self.manifest_cache_path = self.local_root / "manifest.cache.json"
+        self.max_workers = max_workers
         self.session = requests.Session()
+        # 동시 다운로드 시에도 연결을 재사용하도록 풀 크기를 워커 수 이상으로 잡는다.
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(16, max_workers))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def check_for_updates(self) -> Union[List[str], bool]:
         """서버 manifest와 로컬 manifest를 비교해 업데이트 대상 파일 목록을 반환합니다.
@@ -42,7 +57,8 @@ class AutoPatcher:
             업데이트가 필요한 상대 경로 리스트. 네트워크 오류 시 False.
 
         Note:
-            - URL 캐싱을 피하려고 타임스탬프 쿼리를 붙여 매번 강제 최신을 받습니다.
+            - manifest는 조건부 GET으로 확인하며, 304면 이전에 받아 둔 manifest를 그대로 씁니다.
+            - 버전이 달라도 manifest의 sha256이 로컬 파일 해시와 같으면 대상에서 뺍니다.
             - 예외 발생 시 "오프라인 모드로 실행합니다"를 로그에 남기고 False를 반환합니다.
         """
         try:
@@ -50,23 +66,31 @@ class AutoPatcher:
             if server_manifest is None:
                 return False
             local_manifest = self._load_local_manifest()
-            server_files: Dict[str, str] = server_manifest.get("files", {}) if isinstance(server_manifest, dict) else {}
-            local_files: Dict[str, str] = local_manifest.get("files", {}) if isinstance(local_manifest, dict) else {}
+            server_files: Dict[str, object] = server_manifest.get("files", {}) if isinstance(server_manifest, dict) else {}
+            local_files: Dict[str, object] = local_manifest.get("files", {}) if isinstance(local_manifest, dict) else {}
 
             to_update: List[str] = []
-            for rel_path, ver in server_files.items():
-                if local_files.get(rel_path) != ver:
-                    to_update.append(rel_path)
+            for rel_path, entry in server_files.items():
+                if self._entry_version(local_files.get(rel_path)) == self._entry_version(entry):
+                    continue
+                expected = entry.get("sha256") if isinstance(entry, dict) else None
+                if expected and self._local_sha256(rel_path) == str(expected).lower():
+                    # 버전 표기만 바뀌고 내용은 같은 파일
+                    continue
+                to_update.append(rel_path)
             return to_update
         except Exception as exc:  # 방어적: 어떤 예외라도 앱이 죽지 않게 잡는다
             log.warning("오프라인 모드로 실행합니다 (manifest 확인 실패: %s)", exc)
             return False
 
-    def download_updates(self, file_list: List[str]) -> bool:
+    def download_updates(
+        self, file_list: List[str], on_file_done: Optional[Callable[[str, bool], None]] = None
+    ) -> bool:
         """서버에서 파일을 받아 로컬에 덮어씁니다.
 
         Args:
             file_list: 업데이트가 필요한 상대 경로 목록 (예: "data/items.json")
+            on_file_done: 파일 하나가 끝날 때마다 (상대 경로, 성공 여부)로 호출 (진행률 표시용, 호출 스레드에서 실행)
 
         Returns:
             True: 모두 성공, False: 네트워크/저장 실패로 일부라도 내려받지 못함.
@@ -75,46 +99,125 @@ class AutoPatcher:
             - 다운로드 중 전원이 꺼지거나 네트워크가 끊기면 파일이 깨질 수 있어, 같은 위치에 .tmp로 먼저 저장합니다.
             - .tmp 저장이 끝까지 성공하면 그때 최종 파일로 교체합니다(원자적 교체에 가까움).
             - GitHub CDN 캐시를 우회하기 위해 매 요청에 현재 시각을 쿼리로 붙입니다.
+            - 파일이 여러 개면 스레드 풀로 동시에 내려받고, 하나라도 실패하면 False를 반환합니다.
         """
         if not file_list:
             return True
-        try:
+        workers = min(self.max_workers, len(file_list))
+        success_all = True
+        if workers <= 1:
             for rel_path in file_list:
-                url = self._build_url(rel_path)
-                target_path = self.local_root / rel_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                tmp_path = target_path.with_suffix(target_path.suffix + ".tmp")
-
-                resp = self.session.get(url, timeout=self.timeout, stream=True)
-                if resp.status_code != 200:
-                    raise RuntimeError(f"HTTP {resp.status_code}: {url}")
-
-                # 임시 파일로 먼저 저장
-                with tmp_path.open("wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        if not chunk:
-                            continue
-                        f.write(chunk)
-
-                # 다운로드 완료 후 원본 교체
-                tmp_path.replace(target_path)
+                ok = self._download_one(rel_path)
+                success_all = success_all and ok
+                if on_file_done is not None:
+                    on_file_done(rel_path, ok)
+            return success_all
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._download_one, rel_path): rel_path for rel_path in file_list}
+            for future in as_completed(futures):
+                ok = future.result()
+                success_all = success_all and ok
+                if on_file_done is not None:
+                    on_file_done(futures[future], ok)
+        return success_all
+
+    # --------------------
+    # 내부 헬퍼
+    # --------------------
+    def _download_one(self, rel_path: str) -> bool:
+        """파일 하나를 .tmp로 받은 뒤 원본과 교체. 실패 시 False."""
+        try:
+            url = self._build_url(rel_path)
+            target_path = self.local_root / rel_path
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = Path(f"{target_path}.tmp")
+
+            resp = self.session.get(url, timeout=self.timeout, stream=True)
+            if resp.status_code != 200:
+                raise RuntimeError(f"HTTP {resp.status_code}: {url}")
+
+            # 임시 파일로 먼저 저장 (gzip 등 전송 인코딩은 풀어서 기록)
+            resp.raw.decode_content = True
+            with resp, tmp_path.open("wb") as f:
+                shutil.copyfileobj(resp.raw, f, length=65536)
+
+            # 다운로드 완료 후 원본 교체
+            tmp_path.replace(target_path)
             return True
         except Exception as exc:
             log.warning("오프라인 모드로 실행합니다 (다운로드 실패: %s)", exc)
             # 실패 시 tmp 파일이 남더라도 다음 실행에서 덮어쓰게 둔다
             return False
 
-    # --------------------
-    # 내부 헬퍼
-    # --------------------
     def _fetch_manifest(self) -> Optional[Dict[str, object]]:
-        """서버 manifest를 가져옵니다. 실패 시 None."""
-        url = self._build_url(self.manifest_name)
-        resp = self.session.get(url, timeout=self.timeout)
+        """서버 manifest를 가져옵니다. 304면 캐시된 manifest, 실패 시 None."""
+        url = self._build_url(self.manifest_name, cache_bust=False)
+        cached = self._load_manifest_cache()
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        resp = self.session.get(url, timeout=self.timeout, headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            return cached["manifest"]
         if resp.status_code != 200:
             log.warning("manifest 요청 실패: %s (status=%s)", url, resp.status_code)
             return None
-        return resp.json()
+        manifest = resp.json()
+        self._save_manifest_cache(
+            {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "manifest": manifest,
+            }
+        )
+        return manifest
+
+    def _load_manifest_cache(self) -> Optional[Dict[str, object]]:
+        """사이드카에 저장된 manifest 캐시를 읽습니다. 없거나 깨졌으면 None."""
+        try:
+            with self.manifest_cache_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get("manifest"), dict):
+            return None
+        return data
+
+    def _save_manifest_cache(self, data: Dict[str, object]) -> None:
+        """manifest 캐시를 임시 파일에 쓴 뒤 교체. 실패해도 다음 실행에서 전체를 다시 받을 뿐이다."""
+        if not data.get("etag") and not data.get("last_modified"):
+            return
+        tmp_path = self.manifest_cache_path.with_suffix(".json.tmp")
+        try:
+            self.manifest_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_path.replace(self.manifest_cache_path)
+        except OSError as exc:
+            log.warning("manifest 캐시 저장 실패: %s", exc)
+
+    @staticmethod
+    def _entry_version(entry: object) -> object:
+        """manifest 항목에서 버전 값만 꺼낸다. (문자열/딕셔너리 형식 모두 지원)"""
+        if isinstance(entry, dict):
+            return entry.get("v")
+        return entry
+
+    def _local_sha256(self, rel_path: str) -> Optional[str]:
+        """로컬 파일의 sha256 hex. 파일이 없거나 읽기 실패 시 None."""
+        path = self.local_root / rel_path
+        try:
+            digest = hashlib.sha256()
+            with path.open("rb") as f:
+                # hashlib.file_digest는 3.11+ 전용이라 직접 나눠 읽는다 (3.10 지원)
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        except OSError:
+            return None
 
     def _load_local_manifest(self) -> Dict[str, object]:
         """로컬 manifest.json을 읽습니다. 없으면 기본 구조 반환."""
@@ -124,8 +227,10 @@ class AutoPatcher:
         with path.open("r", encoding="utf-8") as f:
             return json.load(f)
 
-    def _build_url(self, rel_path: str) -> str:
-        """캐시 무시용 타임스탬프 쿼리를 포함한 완전한 Raw URL 구성."""
+    def _build_url(self, rel_path: str, cache_bust: bool = True) -> str:
+        """완전한 Raw URL 구성. cache_bust면 캐시 무시용 타임스탬프 쿼리를 붙인다."""
+        if not cache_bust:
+            return f"{self.base_url}{rel_path}"
         timestamp = int(time.time())
         # GitHub Raw는 단순 경로 연결로 접근 가능. 끝에 ?t= 로 캐시를 무시한다.
         return f"{self.base_url}{rel_path}?t={timestamp}"
@@ -1,16 +1,200 @@
 from __future__ import annotations
 
+import heapq
 import random
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from .entities import Player, Enemy, BattleResult
-from .effects import apply_effect, tick_end_of_turn, can_act, clear_all_battle_effects, roll_chance
+from .effects import EffectSpec, apply_effect, tick_end_of_turn, can_act, clear_all_battle_effects, roll_chance
 from . import loot
 from . import items as items_util
 
 
-@dataclass
+# 전투 로그 항목: 완성된 문자열 또는 (코드, 인자...) 튜플. 튜플은 화면에 그릴 때 render_logs로 포맷한다.
+LogEntry = Union[str, Tuple[object, ...]]
+
+LOG_BATTLE_START = 0
+LOG_PLAYER_SKILL = 1
+LOG_PLAYER_HIT = 2
+LOG_ENEMY_HP = 3
+LOG_ENEMY_SKILL = 4
+LOG_ENEMY_HIT = 5
+LOG_PLAYER_HP = 6
+LOG_LIFESTEAL = 7
+
+_LOG_TEMPLATES: Dict[int, str] = {
+    LOG_BATTLE_START: "{0}와(과) 전투 시작!",
+    LOG_PLAYER_SKILL: "플레이어가 {0} 사용!",
+    LOG_PLAYER_HIT: "적에게 물리 {0} / 마법 {1} 피해!",
+    LOG_ENEMY_HP: "적 HP: {0}/{1}",
+    LOG_ENEMY_SKILL: "{0}가 {1} 사용!",
+    LOG_ENEMY_HIT: "플레이어에게 물리 {0} / 마법 {1} 피해!",
+    LOG_PLAYER_HP: "플레이어 HP: {0}/{1}",
+    LOG_LIFESTEAL: "흡혈 발동, 체력 {0}->{1}",
+}
+
+
+class _NullLog(list):
+    """로그를 끈 전투용 리스트. 추가 요청을 모두 버린다."""
+
+    __slots__ = ()
+
+    def append(self, entry: LogEntry) -> None:
+        pass
+
+    def extend(self, entries: Iterable[LogEntry]) -> None:
+        pass
+
+
+LOG_LEVELS = ("full", "off")
+
+
+def render_log(entry: LogEntry) -> str:
+    """로그 항목 하나를 표시용 문자열로 변환."""
+    if isinstance(entry, str):
+        return entry
+    return _LOG_TEMPLATES[entry[0]].format(*entry[1:])
+
+
+def render_logs(logs: Iterable[LogEntry]) -> List[str]:
+    """로그 목록을 표시용 문자열 목록으로 변환."""
+    return [render_log(entry) for entry in logs]
+
+
+# 데이터에 __basic__이 없을 때 쓰는 기본공격 가상 스킬
+_BASIC_SKILL_DATA: Dict[str, object] = {
+    "name": "기본 공격",
+    "type": "physical",
+    "base_physical": 10,
+    "base_magic": 0,
+    "scale": {"attack": 0.2, "magic": 0.0},
+    "cost": 0,
+    "cooldown": 0,
+    "apply_effect": None,
+}
+
+
+_BASIC_POOL = ("__basic__",)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSkill:
+    """전투 계산용으로 미리 풀어 둔 스킬 정의. (매 사용마다 dict 조회를 피함)"""
+
+    name: str
+    kind: str
+    base_physical: float
+    base_magic: float
+    scale_attack: float
+    scale_magic: float
+    cost: int
+    cooldown: int
+    effects: Tuple[EffectSpec, ...] = ()  # apply_effect(배열/단일)를 튜플로 정규화
+
+    @classmethod
+    def from_dict(
+        cls, skill_id: str, data: Dict[str, object], interned: Optional[Dict[EffectSpec, EffectSpec]] = None
+    ) -> "CompiledSkill":
+        scale = data.get("scale", {}) or {}
+        apply_spec = data.get("apply_effect")
+        if isinstance(apply_spec, list):
+            raw_effects = apply_spec
+        elif isinstance(apply_spec, dict):
+            raw_effects = [apply_spec]
+        else:
+            raw_effects = []
+        effects = []
+        for raw in raw_effects:
+            spec = EffectSpec.from_dict(raw)
+            # 같은 내용의 효과 사양은 한 인스턴스를 공유
+            if interned is not None:
+                spec = interned.setdefault(spec, spec)
+            effects.append(spec)
+        return cls(
+            name=data.get("name", skill_id),
+            kind=data.get("type", "physical"),
+            base_physical=data.get("base_physical", 0),
+            base_magic=data.get("base_magic", 0),
+            scale_attack=scale.get("attack", 0),
+            scale_magic=scale.get("magic", 0),
+            cost=data.get("cost", 0),
+            cooldown=data.get("cooldown", 0),
+            effects=tuple(effects),
+        )
+
+
+def _compute_damage(
+    base_physical: float,
+    base_magic: float,
+    attack: float,
+    magic: float,
+    defense: float,
+    magic_resist: float,
+    scale_attack: float,
+    scale_magic: float,
+) -> Tuple[int, int]:
+    """스킬 1회의 (물리, 마법) 피해량. 스탯 수치만 받는 순수 계산 함수."""
+    physical = base_physical + attack * scale_attack
+    magical = base_magic + magic * scale_magic
+    phys_final = physical - defense * scale_attack
+    magic_final = magical - magic_resist * scale_magic
+    # 음수 피해는 0으로 (내장 max 호출 대신 비교식)
+    return (int(phys_final) if phys_final > 0 else 0), (int(magic_final) if magic_final > 0 else 0)
+
+
+@dataclass(slots=True)
+class GimmickPlan:
+    """보스 기믹 발동 일정. 전투마다 첫 기믹 처리 때 한 번 구성한다."""
+
+    actions: List[Optional[Tuple[bool, EffectSpec]]]  # idx -> (플레이어 대상 여부, 효과). 효과 없으면 None
+    once: List[bool]
+    timed: List[Tuple[int, int, int]]  # every_n_turns 힙: (다음 발동 턴, idx, n)
+    hp_keys: List[float]  # hp_below 임계값의 음수, 오름차순 (bisect용)
+    hp_indices: List[int]  # hp_keys와 같은 순서의 기믹 idx
+
+    @classmethod
+    def build(cls, gimmicks: List[Optional[Dict]], turn_index: int) -> "GimmickPlan":
+        actions: List[Optional[Tuple[bool, EffectSpec]]] = []
+        once: List[bool] = []
+        timed: List[Tuple[int, int, int]] = []
+        hp_entries: List[Tuple[float, int]] = []
+        for idx, gimmick in enumerate(gimmicks):
+            gimmick = gimmick or {}
+            action = gimmick.get("action", {})
+            if action.get("type") == "apply_effect":
+                spec = EffectSpec.from_dict(
+                    {
+                        "type": action.get("effect"),
+                        "duration": action.get("duration", 1),
+                        "power": action.get("power", 0),
+                    }
+                )
+                actions.append((action.get("target", "player") == "player", spec))
+            else:
+                actions.append(None)
+            once.append(bool(gimmick.get("once", False)))
+            trigger = gimmick.get("trigger")
+            if trigger == "every_n_turns":
+                n = gimmick.get("n", 1)
+                if n > 0:
+                    # turn_index 이상인 가장 가까운 n의 배수
+                    timed.append((-(-turn_index // n) * n, idx, n))
+            elif trigger == "hp_below":
+                hp_entries.append((-gimmick.get("ratio", 0), idx))
+        heapq.heapify(timed)
+        hp_entries.sort()
+        return cls(
+            actions=actions,
+            once=once,
+            timed=timed,
+            hp_keys=[key for key, _ in hp_entries],
+            hp_indices=[idx for _, idx in hp_entries],
+        )
+
+
+@dataclass(slots=True)
 class BattleState:
     """전투 진행 상태."""
 
@@ -18,47 +202,81 @@ class BattleState:
     enemy: Enemy
     turn: int = 1
     turn_index: int = 1
-    logs: List[str] = field(default_factory=list)
+    logs: List[LogEntry] = field(default_factory=list)
     expected_exp: int = 0
     drop_table_id: Optional[str] = None
-    gimmick_used: Dict[int, bool] = field(default_factory=dict)
+    gimmick_plan: Optional[GimmickPlan] = None
 
 
 class BattleEngine:
     """턴제 전투 엔진."""
 
-    def __init__(self, data_store) -> None:
+    def __init__(self, data_store, seed: Optional[int] = None, log_level: str = "full") -> None:
+        if log_level not in LOG_LEVELS:
+            raise ValueError(f"알 수 없는 log_level: {log_level}")
         self.data_store = data_store
+        # "off"면 전투 로그를 만들지 않는다. (대량 시뮬레이션용)
+        self._log_enabled = log_level == "full"
+        # 전투 난수는 엔진 전용 생성기 하나로 처리 (seed를 주면 전투를 그대로 재현 가능)
+        self._rng = random.Random(seed)
+        self._choice = self._rng.choice
+        self._random = self._rng.random
         self.skills = data_store.skills
         self.items = data_store.items
         self.drop_tables = data_store.drop_tables
+        interned: Dict[EffectSpec, EffectSpec] = {}
+        self._skill_cache: Dict[str, CompiledSkill] = {
+            skill_id: CompiledSkill.from_dict(skill_id, data, interned) for skill_id, data in self.skills.items() if data
+        }
+        if "__basic__" not in self._skill_cache:
+            self._skill_cache["__basic__"] = CompiledSkill.from_dict("__basic__", _BASIC_SKILL_DATA)
+        # 가장 자주 쓰이는 기본공격은 조회 없이 바로 사용
+        self._basic_skill = self._skill_cache["__basic__"]
+        # on_hit 장신구: item_id -> (발동 확률, 효과 사양)
+        self._on_hit_specs: Dict[str, Tuple[float, EffectSpec]] = {}
+        for item_id, item in self.items.items():
+            special = item.get("special") if isinstance(item, dict) else None
+            if special and special.get("type") == "on_hit":
+                spec = EffectSpec.from_dict(
+                    {
+                        "type": special.get("effect"),
+                        "duration": special.get("duration", 1),
+                        "power": special.get("power", 0),
+                        "target": "enemy",
+                    }
+                )
+                self._on_hit_specs[item_id] = (float(special.get("chance", 0)), interned.setdefault(spec, spec))
 
     def start_battle(self, player: Player, enemy: Enemy, expected_exp: int = 0, drop_table_id: Optional[str] = None) -> BattleState:
         state = BattleState(player=player, enemy=enemy, expected_exp=expected_exp, drop_table_id=drop_table_id)
-        state.logs.append(f"{enemy.name}와(과) 전투 시작!")
+        if not self._log_enabled:
+            state.logs = _NullLog()
+        state.logs.append((LOG_BATTLE_START, enemy.name))
         return state
 
     def player_use_skill(self, state: BattleState, skill_id: str) -> Optional[BattleResult]:
         """플레이어 스킬 사용."""
+        return self._player_skill_action(state, self._skill_cache.get(skill_id))
+
+    def player_basic_attack(self, state: BattleState) -> Optional[BattleResult]:
+        """기본공격은 내부 기본 스킬로 처리."""
+        return self._player_skill_action(state, self._basic_skill)
+
+    def _player_skill_action(self, state: BattleState, skill: Optional[CompiledSkill]) -> Optional[BattleResult]:
         if not can_act(state.player, state.logs):
             return self._after_player_action(state)
-        result = self._use_skill(state=state, attacker=state.player, defender=state.enemy, skill_id=skill_id, logs=state.logs, is_player=True)
+        result = self._use_skill(state=state, attacker=state.player, defender=state.enemy, skill=skill, logs=state.logs, is_player=True)
         if result:
             return result
         if state.enemy.is_dead():
             return self._finish(state, winner="player")
         return self._after_player_action(state)
 
-    def player_basic_attack(self, state: BattleState) -> Optional[BattleResult]:
-        """기본공격은 내부 기본 스킬로 처리."""
-        return self.player_use_skill(state, "__basic__")
-
     def player_use_item(self, state: BattleState, item_id: str) -> Optional[BattleResult]:
         if not can_act(state.player, state.logs):
             return self._after_player_action(state)
         # 인벤토리 보유 체크
-        inv = items_util._ensure_inventory_dict(state.player)  # 내부 용도: dict 강제
-        if inv.get(item_id, 0) <= 0:
+        if state.player.inventory.get(item_id, 0) <= 0:
             state.logs.append("해당 아이템이 없습니다")
             return self._after_player_action(state)
         success, msg = items_util.apply_consumable_in_battle(state.player, item_id, self.data_store, state.logs)
@@ -68,6 +286,55 @@ class BattleEngine:
             state.logs.append(msg)
         return self._after_player_action(state)
 
+    def simulate_batch(
+        self,
+        make_player: Callable[[], Player],
+        make_enemy: Callable[[], Enemy],
+        n: int,
+        max_turns: int = 200,
+    ) -> Dict[str, float]:
+        """밸런스 점검용: 같은 구성의 전투를 n번 자동 진행해 요약 통계를 반환.
+
+        make_player/make_enemy는 매 전투마다 새 객체를 만들어야 한다. (전투가 HP/효과를 바꾸므로)
+        플레이어는 매 턴 보유 스킬 중 하나를 무작위로 쓰며, 엔진 난수를 쓰므로 seed를 주면 결과가 재현된다.
+        시뮬레이션 동안에는 전투 로그를 만들지 않는다.
+        """
+        log_enabled = self._log_enabled
+        self._log_enabled = False
+        try:
+            return self._simulate_batch(make_player, make_enemy, n, max_turns)
+        finally:
+            self._log_enabled = log_enabled
+
+    def _simulate_batch(
+        self,
+        make_player: Callable[[], Player],
+        make_enemy: Callable[[], Enemy],
+        n: int,
+        max_turns: int,
+    ) -> Dict[str, float]:
+        wins = 0
+        finished = 0
+        total_turns = 0
+        for _ in range(n):
+            player = make_player()
+            state = self.start_battle(player, make_enemy())
+            pool = player.skills or _BASIC_POOL
+            result = None
+            while result is None and state.turn <= max_turns:
+                result = self.player_use_skill(state, self._choice(pool))
+            total_turns += state.turn
+            if result is not None:
+                finished += 1
+                wins += result.winner == "player"
+        return {
+            "battles": n,
+            "player_wins": wins,
+            "unfinished": n - finished,
+            "win_rate": wins / n if n else 0.0,
+            "avg_turns": total_turns / n if n else 0.0,
+        }
+
     def _after_player_action(self, state: BattleState) -> Optional[BattleResult]:
         # 적 행동
         result = self._enemy_action(state)
@@ -88,10 +355,12 @@ class BattleEngine:
             self._handle_gimmicks(state)
 
         # 기본 AI: 스킬 목록에서 랜덤 선택, 없으면 기본공격
-        pool = state.enemy.skills if state.enemy.skills else ["__basic__"]
-        skill_choice = random.choice(pool)
+        # (데이터 로드 시 적 스킬은 비어 있지 않은 튜플로 정리된다)
+        skill_choice = self._choice(state.enemy.skills or _BASIC_POOL)
 
-        result = self._use_skill(state=state, attacker=state.enemy, defender=state.player, skill_id=skill_choice, logs=state.logs, is_player=False)
+        result = self._use_skill(
+            state=state, attacker=state.enemy, defender=state.player, skill=self._skill_cache.get(skill_choice), logs=state.logs, is_player=False
+        )
         if result:
             return result
         if state.player.hp <= 0:
@@ -99,8 +368,9 @@ class BattleEngine:
         return None
 
     def _end_of_turn(self, state: BattleState) -> Optional[BattleResult]:
-        for target in [state.player, state.enemy]:
-            tick_end_of_turn(target, state.logs)
+        logs = state.logs
+        tick_end_of_turn(state.player, logs)
+        tick_end_of_turn(state.enemy, logs)
         if state.player.hp <= 0:
             return self._finish(state, winner="enemy")
         if state.enemy.is_dead():
@@ -109,158 +379,145 @@ class BattleEngine:
 
     def _finish(self, state: BattleState, winner: str) -> BattleResult:
         drops: List[tuple[str, int]] = []
+        display: List[str] = []
         if winner == "player" and state.drop_table_id:
-            drops = loot.roll_drop(state.drop_table_id, self.data_store, random)
-            display = []
-            for item_id, qty in drops:
-                name = self.items.get(item_id, {}).get("name", item_id)
-                display.append(f"{name} x{qty}")
-            state.logs.append(f"드랍: {', '.join(display) if display else '없음'}")
+            drops = loot.roll_drop(state.drop_table_id, self.data_store, self._rng)
+            items = self.items
+            # 로그와 결과에 같은 표시 문자열 목록을 공유
+            display = [f"{items.get(item_id, {}).get('name', item_id)} x{qty}" for item_id, qty in drops]
+            if self._log_enabled:
+                state.logs.append(f"드랍: {', '.join(display) if display else '없음'}")
         result = BattleResult(
             winner=winner,
             exp=state.expected_exp if winner == "player" else 0,
-            drops=[f"{self.items.get(i, {}).get('name', i)} x{q}" for i, q in drops],
+            drops=display,
             drop_details=drops,
-            logs=list(state.logs),
+            # 복사하지 않고 전투 상태의 로그 리스트를 그대로 넘긴다.
+            # (종료 후 UI 갱신과 경험치 로그 추가가 같은 리스트를 쓰므로 state.logs는 비우지 않음)
+            logs=state.logs,
         )
         # 전투 종료 시 효과를 비워 전투 간 누적을 방지
         clear_all_battle_effects(state.player)
         clear_all_battle_effects(state.enemy)
         # 전투 종료 후 플레이어 체력을 최대치로 회복
         if isinstance(state.player, Player):
-            try:
-                max_hp = state.player.get_total_stats(self.items).max_hp
-            except TypeError:
-                max_hp = state.player.get_total_stats().max_hp
-            state.player.hp = max_hp
+            state.player.hp = state.player.get_total_stats(self.items).max_hp
         return result
 
-    def _use_skill(self, state: BattleState, attacker: Player | Enemy, defender: Player | Enemy, skill_id: str, logs: List[str], is_player: bool) -> Optional[BattleResult]:
-        """스킬 1회 사용 처리."""
-        # 기본공격 가상 스킬
-        skill_data = self.skills.get(skill_id)
-        if skill_id == "__basic__" and not skill_data:
-            skill_data = {
-                "name": "기본 공격",
-                "type": "physical",
-                "base_physical": 10,
-                "base_magic": 0,
-                "scale": {"attack": 0.2, "magic": 0.0},
-                "cost": 0,
-                "cooldown": 0,
-                "apply_effect": None,
-            }
-        if not skill_data:
+    def _use_skill(
+        self, state: BattleState, attacker: Player | Enemy, defender: Player | Enemy, skill: Optional[CompiledSkill], logs: List[LogEntry], is_player: bool
+    ) -> Optional[BattleResult]:
+        """스킬 1회 사용 처리. skill이 None이면 알 수 없는 스킬."""
+        if skill is None:
             logs.append("알 수 없는 스킬")
             return None
 
-        atk_stats = attacker.get_total_stats(self.items) if isinstance(attacker, Player) else attacker.get_total_stats()
-        def_stats = defender.get_total_stats(self.items) if isinstance(defender, Player) else defender.get_total_stats()
-
-        scale = skill_data.get("scale", {}) or {}
-        base_physical = skill_data.get("base_physical", 0)
-        base_magic = skill_data.get("base_magic", 0)
-        scale_attack = scale.get("attack", 0)
-        scale_magic = scale.get("magic", 0)
+        items = self.items
+        atk_stats = attacker.get_total_stats(items)
+        def_stats = defender.get_total_stats(items)
+        # apply_effect에 넘길 items는 대상 종류에 따라 전투 내내 고정
+        attacker_items = items if isinstance(attacker, Player) else None
+        defender_items = items if isinstance(defender, Player) else None
 
         # 데미지 계산
-        physical = base_physical + atk_stats.attack * scale_attack
-        magic = base_magic + atk_stats.magic * scale_magic
-
-        phys_final = max(0, physical - def_stats.defense * scale_attack)
-        magic_final = max(0, magic - def_stats.magic_resist * scale_magic)
-
-        phys_int = int(phys_final)
-        magic_int = int(magic_final)
+        phys_int, magic_int = _compute_damage(
+            skill.base_physical,
+            skill.base_magic,
+            atk_stats.attack,
+            atk_stats.magic,
+            def_stats.defense,
+            def_stats.magic_resist,
+            skill.scale_attack,
+            skill.scale_magic,
+        )
         total_damage = phys_int + magic_int
 
         defender.apply_damage(total_damage)
 
-        if is_player:
-            logs.append(f"플레이어가 {skill_data.get('name', skill_id)} 사용!")
-            logs.append(f"적에게 물리 {phys_int} / 마법 {magic_int} 피해!")
-            logs.append(f"적 HP: {defender.hp}/{def_stats.max_hp}")
-        else:
-            logs.append(f"{attacker.name}가 {skill_data.get('name', skill_id)} 사용!")
-            logs.append(f"플레이어에게 물리 {phys_int} / 마법 {magic_int} 피해!")
-            logs.append(f"플레이어 HP: {defender.hp}/{def_stats.max_hp}")
+        if self._log_enabled:
+            if is_player:
+                logs.append((LOG_PLAYER_SKILL, skill.name))
+                logs.append((LOG_PLAYER_HIT, phys_int, magic_int))
+                logs.append((LOG_ENEMY_HP, defender.hp, def_stats.max_hp))
+            else:
+                logs.append((LOG_ENEMY_SKILL, attacker.name, skill.name))
+                logs.append((LOG_ENEMY_HIT, phys_int, magic_int))
+                logs.append((LOG_PLAYER_HP, defender.hp, def_stats.max_hp))
 
         # apply_effect 처리 (배열/단일)
         lifesteal_power = 0.0
-        apply_spec = skill_data.get("apply_effect")
-        effect_list = []
-        if isinstance(apply_spec, list):
-            effect_list = apply_spec
-        elif isinstance(apply_spec, dict):
-            effect_list = [apply_spec]
-
-        for eff in effect_list:
-            target_label = eff.get("target", "self")
-            target = attacker if target_label == "self" else defender
-            eff_type = eff.get("type") or eff.get("effect")
-
-            if eff_type == "lifesteal":
-                lifesteal_power += float(eff.get("power", 0))
+        # 시전자에게 효과가 걸리면 스탯이 바뀌므로 흡혈 상한 계산 시 다시 구한다.
+        attacker_changed = False
+        for eff in skill.effects:
+            if eff.kind == "lifesteal":
+                lifesteal_power += eff.power
                 continue
-            apply_effect(target, eff, logs, rng=random, items=self.items if isinstance(target, Player) else None)
+            if eff.target == "self":
+                apply_effect(attacker, eff, logs, rng=self._rng, items=attacker_items)
+                attacker_changed = True
+            else:
+                apply_effect(defender, eff, logs, rng=self._rng, items=defender_items)
 
         # on_hit 장신구 처리 (플레이어만 대상)
         if is_player:
-            accessory = attacker.equipment.get("accessory") if isinstance(attacker, Player) else None
-            if accessory:
-                item = self.items.get(accessory, {})
-                special = item.get("special") if isinstance(item, dict) else None
-                if special and special.get("type") == "on_hit":
-                    if roll_chance(float(special.get("chance", 0)), random):
-                        spec = {
-                            "type": special.get("effect"),
-                            "duration": special.get("duration", 1),
-                            "power": special.get("power", 0),
-                            "target": "enemy",
-                        }
-                        apply_effect(defender, spec, logs, rng=random, items=self.items if isinstance(defender, Player) else None)
+            accessory = attacker.equipment.get("accessory") if attacker_items is not None else None
+            on_hit = self._on_hit_specs.get(accessory) if accessory else None
+            if on_hit is not None and roll_chance(on_hit[0], rng_random=self._random):
+                apply_effect(defender, on_hit[1], logs, rng=self._rng, items=defender_items)
 
         # lifesteal 처리 (총 피해량 기준)
         if lifesteal_power > 0:
             heal_amount = int(total_damage * lifesteal_power)
             before = attacker.hp
-            max_hp = attacker.get_total_stats(self.items).max_hp if isinstance(attacker, Player) else attacker.get_total_stats().max_hp
+            max_hp = (attacker.get_total_stats(items) if attacker_changed else atk_stats).max_hp
             attacker.hp = min(max_hp, attacker.hp + heal_amount)
-            logs.append(f"흡혈 발동, 체력 {before}->{attacker.hp}")
+            if self._log_enabled:
+                logs.append((LOG_LIFESTEAL, before, attacker.hp))
 
         if defender.hp <= 0:
             return self._finish(state, winner="player" if is_player else "enemy")
         return None
 
     def _handle_gimmicks(self, state: BattleState) -> None:
-        """보스 기믹 발동 처리."""
-        gimmicks = getattr(state.enemy, "gimmicks", []) or []
-        for idx, gimmick in enumerate(gimmicks):
-            if gimmick is None:
+        """보스 기믹 발동 처리.
+
+        매 턴 모든 기믹을 훑지 않고, 턴 기믹은 다음 발동 턴 힙에서, 체력 기믹은 임계값 정렬 목록에서 꺼낸다.
+        """
+        plan = state.gimmick_plan
+        if plan is None:
+            gimmicks = getattr(state.enemy, "gimmicks", []) or []
+            plan = state.gimmick_plan = GimmickPlan.build(gimmicks, state.turn_index)
+        turn = state.turn_index
+        due: List[int] = []
+
+        timed = plan.timed
+        while timed and timed[0][0] <= turn:
+            next_turn, idx, n = heapq.heappop(timed)
+            if next_turn < turn:
+                # 기절 등으로 처리되지 못한 턴은 건너뛰고 다음 배수로 다시 예약
+                heapq.heappush(timed, (-(-turn // n) * n, idx, n))
                 continue
-            once = gimmick.get("once", False)
-            if once and state.gimmick_used.get(idx):
-                continue
-            trigger = gimmick.get("trigger")
-            should_fire = False
-            if trigger == "every_n_turns":
-                n = gimmick.get("n", 1)
-                should_fire = n > 0 and state.turn_index % n == 0
-            elif trigger == "hp_below":
-                ratio = gimmick.get("ratio", 0)
-                max_hp = state.enemy.stats.max_hp or 1
-                should_fire = (state.enemy.hp / max_hp) <= ratio
-            if not should_fire:
-                continue
-            action = gimmick.get("action", {})
-            if action.get("type") == "apply_effect":
-                target_label = action.get("target", "player")
-                target = state.player if target_label == "player" else state.enemy
-                spec = {
-                    "type": action.get("effect"),
-                    "duration": action.get("duration", 1),
-                    "power": action.get("power", 0),
-                }
-                apply_effect(target=target, effect_spec=spec, logs=state.logs, rng=random, items=self.items if isinstance(target, Player) else None)
-            if once:
-                state.gimmick_used[idx] = True
+            due.append(idx)
+            if not plan.once[idx]:
+                heapq.heappush(timed, (turn + n, idx, n))
+
+        if plan.hp_keys:
+            hp_ratio = state.enemy.hp / (state.enemy.stats.max_hp or 1)
+            count = bisect_right(plan.hp_keys, -hp_ratio)
+            if count:
+                fired = plan.hp_indices[:count]
+                due.extend(fired)
+                # 1회성 체력 기믹은 목록에서 제거
+                for pos in range(count - 1, -1, -1):
+                    if plan.once[fired[pos]]:
+                        del plan.hp_keys[pos]
+                        del plan.hp_indices[pos]
+
+        if len(due) > 1:
+            due.sort()
+        for idx in due:
+            entry = plan.actions[idx]
+            if entry is not None:
+                targets_player, spec = entry
+                target = state.player if targets_player else state.enemy
+                apply_effect(target=target, effect_spec=spec, logs=state.logs, rng=self._rng, items=self.items if isinstance(target, Player) else None)
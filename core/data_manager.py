@@ -7,10 +7,19 @@ from __future__ import annotations
 - 모든 반환값은 dataclass 모델을 사용하여 타입 안정성을 보장합니다.
 """
 
+import gc
 import json
 import logging
+import mmap
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
 
 from .models import (
     Boss,
@@ -20,6 +29,7 @@ from .models import (
     DungeonZone,
     DungeonsData,
     DropEntry,
+    Equipment,
     Item,
     ItemSpecial,
     ItemsData,
@@ -37,6 +47,94 @@ from .models import (
     UseEffect,
 )
 
+try:  # 선택 의존성: 있으면 JSON 파싱/직렬화를 orjson으로 처리
+    import orjson
+except ImportError:  # pragma: no cover - 표준 json으로 대체
+    orjson = None
+
+T = TypeVar("T")
+
+# 모델 구조가 바뀌면 올려서 기존 .pkl 캐시를 무효화
+_PICKLE_CACHE_VERSION = 4
+
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# stats 블록이 비어 있는 엔티티는 불변 Stats 하나를 공유
+_EMPTY_STATS = Stats()
+
+_WARN_ITEM = "items.json: '%s' 파싱 실패, 기본값으로 대체 (%s)"
+_WARN_SKILL = "skills.json: '%s' 파싱 실패, 기본값으로 대체 (%s)"
+_WARN_MONSTER = "monsters.json: '%s' 파싱 실패, 기본 몬스터로 대체 (%s)"
+_WARN_DUNGEON_BOSS = "bosses.json: dungeon boss '%s' 파싱 실패 (%s)"
+_WARN_SPECIAL_BOSS = "bosses.json: special boss '%s' 파싱 실패 (%s)"
+_WARN_ZONE = "dungeons.json: zone '%s' 파싱 실패, 빈 존으로 대체 (%s)"
+
+
+_gc_lock = threading.Lock()
+_gc_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """모델 트리를 대량 생성/복원하는 동안 순환 GC를 멈춥니다. (prefetch 스레드끼리 중첩 허용)"""
+    global _gc_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_depth -= 1
+            if _gc_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def _read_all(path: Path) -> bytes:
+    """Path/텍스트 래퍼 없이 fd로 파일 전체를 읽습니다."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _read_json_file(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 기존 예외 처리가 그대로 적용됨
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:  # 빈 파일은 mmap할 수 없음
+                return orjson.loads(b"")
+            # 페이지 캐시를 그대로 파서에 넘겨 read() 버퍼 복사를 생략
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    return json.loads(_read_all(path))
+
+
+def _intern_ids(raw_ids: Any) -> List[str]:
+    """스킬/몬스터 id 목록을 intern해 여러 엔티티가 같은 id 문자열 객체를 공유하게 합니다."""
+    intern = sys.intern
+    return [intern(str(x)) for x in raw_ids]
+
+
+@lru_cache(maxsize=32)
+def _cached_parse(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """(경로, mtime, 크기)가 같으면 인스턴스를 넘어 파싱 결과를 재사용합니다. 반환 dict는 공유되므로 수정하지 않습니다."""
+    return _read_json_file(Path(path_str))
+
 
 class DataManager:
     def __init__(self, data_dir: Path) -> None:
@@ -48,6 +146,8 @@ class DataManager:
         self._bosses_cache: Optional[BossesData] = None
         self._dungeons_cache: Optional[DungeonsData] = None
         self._players_cache: Optional[PlayersData] = None
+        # 전체 load_* 전에 get_*로 조회된 엔트리만 개별 파싱해 보관: (블록, id) -> 모델
+        self._lazy_entries: Dict[tuple, Any] = {}
 
     # --------------------
     # Public load/save API
@@ -55,17 +155,15 @@ class DataManager:
     def load_items(self, force: bool = False) -> ItemsData:
         if self._items_cache and not force:
             return self._items_cache
+        self._items_cache = self._load_cached(self.paths.items, self._build_items)
+        return self._items_cache
+
+    def _build_items(self) -> ItemsData:
         raw = self._safe_load_json(self.paths.items)
         version = raw.get("version", "0.0.0")
         raw_items = raw.get("items", {}) or {}
         raw_tables = raw.get("drop_tables", {}) or {}
-        items: Dict[str, Item] = {}
-        for item_id, payload in raw_items.items():
-            try:
-                items[item_id] = self._parse_item(item_id, payload)
-            except Exception as exc:  # 방어적: 손상 데이터 폴백
-                self.log.warning("items.json: '%s' 파싱 실패, 기본값으로 대체 (%s)", item_id, exc)
-                items[item_id] = self._fallback_item(item_id)
+        items = self._parse_entries(raw_items, self._parse_item, self._fallback_item, _WARN_ITEM)
         drop_tables: Dict[str, List[DropEntry]] = {}
         for table_name, entries in raw_tables.items():
             safe_entries: List[DropEntry] = []
@@ -75,12 +173,13 @@ class DataManager:
                 except Exception as exc:
                     self.log.warning("items.json drop_table '%s' 엔트리 무시 (%s)", table_name, exc)
             drop_tables[table_name] = safe_entries
-        self._items_cache = ItemsData(version=version, items=items, drop_tables=drop_tables)
-        return self._items_cache
+        return ItemsData(version=version, items=items, drop_tables=drop_tables)
 
     def get_item(self, item_id: str) -> Item:
-        data = self.load_items()
-        found = data.items.get(item_id)
+        if self._items_cache is not None:
+            found = self._items_cache.items.get(item_id)
+        else:
+            found = self._lazy_entry(self.paths.items, "items", item_id, self._parse_item, self._fallback_item, _WARN_ITEM)
         if found:
             return found
         self.log.warning("아이템 '%s'을 찾지 못해 기본값을 반환합니다", item_id)
@@ -89,24 +188,25 @@ class DataManager:
     def load_skills(self, force: bool = False) -> SkillsData:
         if self._skills_cache and not force:
             return self._skills_cache
+        self._skills_cache = self._load_cached(self.paths.skills, self._build_skills)
+        return self._skills_cache
+
+    def _build_skills(self) -> SkillsData:
         raw = self._safe_load_json(self.paths.skills)
         version = raw.get("version", "0.0.0")
         skills_raw = raw.get("skills", {}) or {}
-        skills: Dict[str, Skill] = {}
-        for sid, payload in skills_raw.items():
-            try:
-                skills[sid] = self._parse_skill(sid, payload)
-            except Exception as exc:
-                self.log.warning("skills.json: '%s' 파싱 실패, 기본값으로 대체 (%s)", sid, exc)
-                skills[sid] = self._fallback_skill(sid)
+        skills = self._parse_entries(skills_raw, self._parse_skill, self._fallback_skill, _WARN_SKILL)
         if "__basic__" not in skills:
-            skills["__basic__"] = self._fallback_skill("__basic__", name="기본 공격", base_physical=10, scale_attack=0.2)
-        self._skills_cache = SkillsData(version=version, skills=skills)
-        return self._skills_cache
+            skills["__basic__"] = self._fallback_basic_skill()
+        return SkillsData(version=version, skills=skills)
 
     def get_skill(self, skill_id: str) -> Skill:
-        data = self.load_skills()
-        found = data.skills.get(skill_id)
+        if self._skills_cache is not None:
+            found = self._skills_cache.skills.get(skill_id)
+        else:
+            found = self._lazy_entry(self.paths.skills, "skills", skill_id, self._parse_skill, self._fallback_skill, _WARN_SKILL)
+            if found is None and skill_id == "__basic__":
+                found = self._fallback_basic_skill()
         if found:
             return found
         self.log.warning("스킬 '%s'을 찾지 못해 기본 스킬을 반환합니다", skill_id)
@@ -115,22 +215,23 @@ class DataManager:
     def load_monsters(self, force: bool = False) -> MonstersData:
         if self._monsters_cache and not force:
             return self._monsters_cache
+        self._monsters_cache = self._load_cached(self.paths.monsters, self._build_monsters)
+        return self._monsters_cache
+
+    def _build_monsters(self) -> MonstersData:
         raw = self._safe_load_json(self.paths.monsters)
         version = raw.get("version", "0.0.0")
         monsters_raw = raw.get("monsters", {}) or {}
-        monsters: Dict[str, Monster] = {}
-        for mid, payload in monsters_raw.items():
-            try:
-                monsters[mid] = self._parse_monster(mid, payload)
-            except Exception as exc:
-                self.log.warning("monsters.json: '%s' 파싱 실패, 기본 몬스터로 대체 (%s)", mid, exc)
-                monsters[mid] = self._fallback_monster(mid)
-        self._monsters_cache = MonstersData(version=version, monsters=monsters)
-        return self._monsters_cache
+        monsters = self._parse_entries(monsters_raw, self._parse_monster, self._fallback_monster, _WARN_MONSTER)
+        return MonstersData(version=version, monsters=monsters)
 
     def get_monster(self, monster_id: str) -> Monster:
-        data = self.load_monsters()
-        found = data.monsters.get(monster_id)
+        if self._monsters_cache is not None:
+            found = self._monsters_cache.monsters.get(monster_id)
+        else:
+            found = self._lazy_entry(
+                self.paths.monsters, "monsters", monster_id, self._parse_monster, self._fallback_monster, _WARN_MONSTER
+            )
         if found:
             return found
         self.log.warning("몬스터 '%s'을 찾지 못해 기본 몬스터를 반환합니다", monster_id)
@@ -139,30 +240,35 @@ class DataManager:
     def load_bosses(self, force: bool = False) -> BossesData:
         if self._bosses_cache and not force:
             return self._bosses_cache
+        self._bosses_cache = self._load_cached(self.paths.bosses, self._build_bosses)
+        return self._bosses_cache
+
+    def _build_bosses(self) -> BossesData:
         raw = self._safe_load_json(self.paths.bosses)
         version = raw.get("version", "0.0.0")
         dungeon_raw = raw.get("dungeon_bosses", {}) or {}
         special_raw = raw.get("special_bosses", {}) or {}
-        dungeon_bosses: Dict[str, Boss] = {}
-        for bid, payload in dungeon_raw.items():
-            try:
-                dungeon_bosses[bid] = self._parse_boss(bid, payload, is_special=False)
-            except Exception as exc:
-                self.log.warning("bosses.json: dungeon boss '%s' 파싱 실패 (%s)", bid, exc)
-                dungeon_bosses[bid] = self._fallback_boss(bid)
-        special_bosses: Dict[str, Boss] = {}
-        for bid, payload in special_raw.items():
-            try:
-                special_bosses[bid] = self._parse_boss(bid, payload, is_special=True)
-            except Exception as exc:
-                self.log.warning("bosses.json: special boss '%s' 파싱 실패 (%s)", bid, exc)
-                special_bosses[bid] = self._fallback_boss(bid, is_special=True)
-        self._bosses_cache = BossesData(version=version, dungeon_bosses=dungeon_bosses, special_bosses=special_bosses)
-        return self._bosses_cache
+        dungeon_bosses = self._parse_entries(dungeon_raw, self._parse_dungeon_boss, self._fallback_boss, _WARN_DUNGEON_BOSS)
+        special_bosses = self._parse_entries(
+            special_raw, self._parse_special_boss, self._fallback_special_boss, _WARN_SPECIAL_BOSS
+        )
+        return BossesData(version=version, dungeon_bosses=dungeon_bosses, special_bosses=special_bosses)
 
     def get_boss(self, boss_id: str) -> Boss:
-        data = self.load_bosses()
-        found = data.dungeon_bosses.get(boss_id) or data.special_bosses.get(boss_id)
+        if self._bosses_cache is not None:
+            data = self._bosses_cache
+            found = data.dungeon_bosses.get(boss_id) or data.special_bosses.get(boss_id)
+        else:
+            found = self._lazy_entry(
+                self.paths.bosses, "dungeon_bosses", boss_id, self._parse_dungeon_boss, self._fallback_boss, _WARN_DUNGEON_BOSS
+            ) or self._lazy_entry(
+                self.paths.bosses,
+                "special_bosses",
+                boss_id,
+                self._parse_special_boss,
+                self._fallback_special_boss,
+                _WARN_SPECIAL_BOSS,
+            )
         if found:
             return found
         self.log.warning("보스 '%s'을 찾지 못해 기본 보스를 반환합니다", boss_id)
@@ -171,22 +277,21 @@ class DataManager:
     def load_dungeons(self, force: bool = False) -> DungeonsData:
         if self._dungeons_cache and not force:
             return self._dungeons_cache
+        self._dungeons_cache = self._load_cached(self.paths.dungeons, self._build_dungeons)
+        return self._dungeons_cache
+
+    def _build_dungeons(self) -> DungeonsData:
         raw = self._safe_load_json(self.paths.dungeons)
         version = raw.get("version", "0.0.0")
         zones_raw = raw.get("zones", {}) or {}
-        zones: Dict[str, DungeonZone] = {}
-        for zid, payload in zones_raw.items():
-            try:
-                zones[zid] = self._parse_zone(zid, payload)
-            except Exception as exc:
-                self.log.warning("dungeons.json: zone '%s' 파싱 실패, 빈 존으로 대체 (%s)", zid, exc)
-                zones[zid] = DungeonZone(zone_id=zid)
-        self._dungeons_cache = DungeonsData(version=version, zones=zones)
-        return self._dungeons_cache
+        zones = self._parse_entries(zones_raw, self._parse_zone, self._fallback_zone, _WARN_ZONE)
+        return DungeonsData(version=version, zones=zones)
 
     def get_zone(self, zone_id: str) -> DungeonZone:
-        data = self.load_dungeons()
-        zone = data.zones.get(str(zone_id))
+        if self._dungeons_cache is not None:
+            zone = self._dungeons_cache.zones.get(str(zone_id))
+        else:
+            zone = self._lazy_entry(self.paths.dungeons, "zones", str(zone_id), self._parse_zone, self._fallback_zone, _WARN_ZONE)
         if zone:
             return zone
         self.log.warning("존 '%s'을 찾지 못해 빈 존을 반환합니다", zone_id)
@@ -203,19 +308,18 @@ class DataManager:
     def load_players(self, force: bool = False) -> PlayersData:
         if self._players_cache and not force:
             return self._players_cache
+        self._players_cache = self._load_cached(self.paths.players, self._build_players)
+        return self._players_cache
+
+    def _build_players(self) -> PlayersData:
         raw = self._safe_load_json(self.paths.players)
         version = raw.get("version", "0.0.0")
         default_player_id = raw.get("default_player_id")
         profiles_raw = raw.get("players", {}) or {}
-        players: Dict[str, PlayerProfile] = {}
-        for pid, payload in profiles_raw.items():
-            try:
-                players[pid] = self._parse_player_profile(pid, payload)
-            except Exception as exc:
-                self.log.warning("players.json: '%s' 파싱 실패, 기본 프로필로 대체 (%s)", pid, exc)
-                players[pid] = self._fallback_profile(pid)
-        self._players_cache = PlayersData(version=version, default_player_id=default_player_id, players=players)
-        return self._players_cache
+        players = self._parse_entries(
+            profiles_raw, self._parse_player_profile, self._fallback_profile, "players.json: '%s' 파싱 실패, 기본 프로필로 대체 (%s)"
+        )
+        return PlayersData(version=version, default_player_id=default_player_id, players=players)
 
     def get_player_profile(self, player_id: str) -> PlayerProfile:
         data = self.load_players()
@@ -226,16 +330,16 @@ class DataManager:
         return self._fallback_profile(player_id)
 
     def load_save(self) -> SaveData:
-        raw = self._safe_load_json(self.paths.progress, ensure_exists=True)
+        # 진행도는 파싱 결과 일부(dungeon_progress)를 그대로 모델에 담으므로 공유 캐시를 쓰지 않음
+        raw = self._safe_load_json(self.paths.progress, ensure_exists=True, use_cache=False)
         version = raw.get("version", "0.0.0")
         players_block = raw.get("players", {}) or {}
-        players: Dict[str, PlayerProgress] = {}
-        for pid, pdata in players_block.items():
-            try:
-                players[pid] = self._parse_player_progress(pdata)
-            except Exception as exc:
-                self.log.warning("progress.json: '%s' 플레이어 진행도 파싱 실패, 기본값으로 대체 (%s)", pid, exc)
-                players[pid] = PlayerProgress()
+        players = self._parse_entries(
+            players_block,
+            lambda pid, pdata: self._parse_player_progress(pdata),
+            lambda pid: PlayerProgress(),
+            "progress.json: '%s' 플레이어 진행도 파싱 실패, 기본값으로 대체 (%s)",
+        )
         return SaveData(version=version, selected_player_id=raw.get("selected_player_id"), players=players)
 
     def save_progress(self, save_data: SaveData) -> None:
@@ -246,6 +350,20 @@ class DataManager:
         }
         self._write_json(self.paths.progress, payload)
 
+    def prefetch(self) -> None:
+        """모든 데이터 파일을 스레드 풀에서 동시에 로드해 캐시를 채웁니다. (로딩 화면 등에서 호출)"""
+        loaders = (
+            self.load_items,
+            self.load_skills,
+            self.load_monsters,
+            self.load_bosses,
+            self.load_dungeons,
+            self.load_players,
+        )
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            for future in [executor.submit(loader) for loader in loaders]:
+                future.result()
+
     # --------------------
     # Migration stub (version-aware)
     # --------------------
@@ -258,52 +376,87 @@ class DataManager:
     # --------------------
     # Parsing helpers
     # --------------------
+    def _lazy_entry(
+        self,
+        path: Path,
+        block: str,
+        entry_id: str,
+        parse: Callable[[str, Any], T],
+        fallback: Callable[[str], T],
+        warn_msg: str,
+    ) -> Optional[T]:
+        """전체 파일을 모델로 만들지 않고 요청된 엔트리 하나만 파싱합니다. 원본 dict는 _cached_parse가 공유합니다."""
+        key = (block, entry_id)
+        found = self._lazy_entries.get(key)
+        if found is None:
+            payload = (self._safe_load_json(path).get(block) or {}).get(entry_id)
+            if payload is None:
+                return None
+            found = self._parse_entries({entry_id: payload}, parse, fallback, warn_msg)[entry_id]
+            self._lazy_entries[key] = found
+        return found
+
+    def _parse_entries(
+        self,
+        raw: Dict[str, Any],
+        parse: Callable[[str, Any], T],
+        fallback: Callable[[str], T],
+        warn_msg: str,
+    ) -> Dict[str, T]:
+        """정상 데이터는 dict comprehension 한 번으로 파싱하고, 예외가 나면 엔트리별 폴백 루프로 다시 파싱합니다.
+
+        id 키는 intern해 모델의 id 필드와 다른 테이블의 참조가 같은 문자열 객체를 공유하게 합니다.
+        """
+        keys = list(map(sys.intern, raw))
+        try:
+            return {key: parse(key, payload) for key, payload in zip(keys, raw.values())}
+        except Exception:
+            pass
+        parsed: Dict[str, T] = {}
+        for key, payload in zip(keys, raw.values()):
+            try:
+                parsed[key] = parse(key, payload)
+            except Exception as exc:  # 방어적: 손상 데이터 폴백
+                self.log.warning(warn_msg, key, exc)
+                parsed[key] = fallback(key)
+        return parsed
+
     def _parse_item(self, item_id: str, payload: Dict[str, Any]) -> Item:
-        stats_raw = payload.get("stats", {}) or {}
-        special_raw = payload.get("special")
-        use_effect_raw = payload.get("use_effect")
+        # 아이템 수만큼 호출되는 경로: get을 지역에 묶고 Item 필드 순서대로 위치 인자로 생성
+        get = payload.get
+        stats_raw = get("stats")
+        special_raw = get("special")
+        use_effect_raw = get("use_effect")
         return Item(
-            id=item_id,
-            name=payload.get("name", item_id),
-            type=payload.get("type", "equipment"),
-            rarity=payload.get("rarity", "common"),
-            desc=payload.get("desc", ""),
-            icon=payload.get("icon"),
-            slot=payload.get("slot"),
-            stats=Stats(**{k: int(stats_raw.get(k, 0)) for k in ["attack", "magic", "defense", "magic_resist", "max_hp"]}),
-            special=ItemSpecial(**special_raw) if isinstance(special_raw, dict) else None,
-            use_effect=UseEffect(**use_effect_raw) if isinstance(use_effect_raw, dict) else None,
+            item_id,
+            get("name", item_id),
+            get("type", "equipment"),
+            get("rarity", "common"),
+            get("desc", ""),
+            get("icon"),
+            get("slot"),
+            Stats.from_raw(stats_raw) if stats_raw else _EMPTY_STATS,
+            ItemSpecial(**special_raw) if isinstance(special_raw, dict) else None,
+            UseEffect(**use_effect_raw) if isinstance(use_effect_raw, dict) else None,
         )
 
     def _parse_skill(self, skill_id: str, payload: Dict[str, Any]) -> Skill:
-        scale_raw = payload.get("scale", {}) if isinstance(payload.get("scale", {}), dict) else {}
+        scale_raw = payload.get("scale", {})
         effects_raw = payload.get("apply_effect")
-        effect_list: List[Dict[str, Any]] = []
-        if isinstance(effects_raw, list):
-            effect_list = [e for e in effects_raw if isinstance(e, dict)]
-        elif isinstance(effects_raw, dict):
-            effect_list = [effects_raw]
+        if isinstance(effects_raw, dict):
+            effects_raw = (effects_raw,)
+        elif not isinstance(effects_raw, list):
+            effects_raw = ()
         return Skill(
             id=skill_id,
             name=payload.get("name", skill_id),
             type=payload.get("type", "physical"),
             base_physical=float(payload.get("base_physical", 0)),
             base_magic=float(payload.get("base_magic", 0)),
-            scale=SkillScale(attack=float(scale_raw.get("attack", 0.0)), magic=float(scale_raw.get("magic", 0.0))),
+            scale=SkillScale.from_raw(scale_raw) if isinstance(scale_raw, dict) else SkillScale(),
             cost=int(payload.get("cost", 0)),
             cooldown=int(payload.get("cooldown", 0)),
-            apply_effects=[self._parse_skill_effect(eff) for eff in effect_list],
-        )
-
-    def _parse_skill_effect(self, payload: Dict[str, Any]) -> SkillEffect:
-        return SkillEffect(
-            type=payload.get("type") or payload.get("effect", "unknown"),
-            target=payload.get("target", "enemy"),
-            chance=float(payload.get("chance", 1.0)),
-            duration=int(payload.get("duration", 0)),
-            power=float(payload.get("power", 0.0)),
-            stats={k: int(v) for k, v in (payload.get("stats") or {}).items()},
-            scope=payload.get("scope", "battle"),
+            apply_effects=[SkillEffect.from_raw(eff) for eff in effects_raw if isinstance(eff, dict)],
         )
 
     def _parse_monster(self, monster_id: str, payload: Dict[str, Any]) -> Monster:
@@ -311,26 +464,32 @@ class DataManager:
         return Monster(
             id=monster_id,
             name=payload.get("name", monster_id),
-            stats=Stats(**{k: int(stats_raw.get(k, 0)) for k in ["attack", "magic", "defense", "magic_resist", "max_hp"]}),
+            stats=Stats.from_raw(stats_raw) if stats_raw else _EMPTY_STATS,
             ai=payload.get("ai", "basic"),
-            skills=[str(s) for s in payload.get("skills", [])],
-            gimmicks=payload.get("gimmicks", []) or [],
+            skills=_intern_ids(payload.get("skills", [])),
+            gimmicks=list(payload.get("gimmicks") or ()),
             drop_table=payload.get("drop_table"),
         )
 
     def _parse_boss(self, boss_id: str, payload: Dict[str, Any], is_special: bool) -> Boss:
-        monster = self._parse_monster(boss_id, payload)
+        stats_raw = payload.get("stats", {}) or {}
         return Boss(
-            id=monster.id,
-            name=monster.name,
-            stats=monster.stats,
-            ai=monster.ai,
-            skills=monster.skills,
-            gimmicks=monster.gimmicks,
+            id=boss_id,
+            name=payload.get("name", boss_id),
+            stats=Stats.from_raw(stats_raw) if stats_raw else _EMPTY_STATS,
+            ai=payload.get("ai", "basic"),
+            skills=_intern_ids(payload.get("skills", [])),
+            gimmicks=list(payload.get("gimmicks") or ()),
             drop_table=payload.get("drop_table"),
             is_special=is_special,
         )
 
+    def _parse_dungeon_boss(self, boss_id: str, payload: Dict[str, Any]) -> Boss:
+        return self._parse_boss(boss_id, payload, is_special=False)
+
+    def _parse_special_boss(self, boss_id: str, payload: Dict[str, Any]) -> Boss:
+        return self._parse_boss(boss_id, payload, is_special=True)
+
     def _parse_zone(self, zone_id: str, payload: Dict[str, Any]) -> DungeonZone:
         stages_raw = payload.get("stages", {}) or {}
         stages: Dict[str, DungeonStage] = {}
@@ -346,26 +505,22 @@ class DataManager:
         monster_pool = payload.get("monster_pool", []) or []
         boss_id = payload.get("boss_id")
         exp = int(payload.get("exp", 0))
-        return DungeonStage(stage_id=str(stage_id), monster_pool=[str(m) for m in monster_pool], boss_id=boss_id, exp=exp)
+        return DungeonStage(stage_id=str(stage_id), monster_pool=_intern_ids(monster_pool), boss_id=boss_id, exp=exp)
 
     def _parse_player_profile(self, player_id: str, payload: Dict[str, Any]) -> PlayerProfile:
         base_raw = payload.get("base_stats", {}) or {}
         return PlayerProfile(
             id=player_id,
             name=payload.get("name", player_id),
-            base_stats=Stats(**{k: int(base_raw.get(k, 0)) for k in ["attack", "magic", "defense", "magic_resist", "max_hp"]}),
-            skills=[str(s) for s in payload.get("skills", [])],
+            base_stats=Stats.from_raw(base_raw),
+            skills=_intern_ids(payload.get("skills", [])),
         )
 
     def _parse_drop(self, payload: Dict[str, Any]) -> DropEntry:
-        return DropEntry(
-            item=payload.get("item", ""),
-            chance=float(payload.get("chance", 0)),
-            min=int(payload.get("min", 1)),
-            max=int(payload.get("max", 1)),
-        )
+        return DropEntry.from_raw(payload)
 
     def _parse_player_progress(self, payload: Dict[str, Any]) -> PlayerProgress:
+        equipment_raw = payload.get("equipment") or _EMPTY_DICT
         return PlayerProgress(
             level=int(payload.get("level", 1)),
             exp=int(payload.get("exp", 0)),
@@ -374,21 +529,22 @@ class DataManager:
             allocated_stats={k: int(v) for k, v in (payload.get("allocated_stats") or {}).items()},
             hp=int(payload.get("hp", 0)),
             inventory={k: int(v) for k, v in (payload.get("inventory") or {}).items()},
-            equipment={k: payload.get("equipment", {}).get(k) for k in ["weapon", "armor", "accessory"]},
+            equipment=Equipment.from_raw(equipment_raw),
             dungeon_progress=payload.get("dungeon_progress", {}),
         )
 
     def _dump_player(self, player: PlayerProgress) -> Dict[str, Any]:
+        # save_progress가 즉시 직렬화하므로 내부 dict를 복사하지 않고 그대로 넘김
         return {
             "level": player.level,
             "exp": player.exp,
             "exp_to_next": player.exp_to_next,
             "stat_points": player.stat_points,
-            "allocated_stats": dict(player.allocated_stats),
+            "allocated_stats": player.allocated_stats,
             "hp": player.hp,
-            "inventory": dict(player.inventory),
-            "equipment": dict(player.equipment),
-            "dungeon_progress": dict(player.dungeon_progress),
+            "inventory": player.inventory,
+            "equipment": player.equipment.to_dict(),
+            "dungeon_progress": player.dungeon_progress,
         }
 
     # --------------------
@@ -403,7 +559,7 @@ class DataManager:
             desc="",
             icon=None,
             slot=None,
-            stats=Stats(),
+            stats=_EMPTY_STATS,
         )
 
     def _fallback_skill(self, skill_id: str, name: Optional[str] = None, base_physical: float = 0.0, scale_attack: float = 0.0) -> Skill:
@@ -420,7 +576,7 @@ class DataManager:
         )
 
     def _fallback_monster(self, monster_id: str) -> Monster:
-        return Monster(id=monster_id, name=monster_id, stats=Stats(), ai="basic", skills=["__basic__"], gimmicks=[])
+        return Monster(id=monster_id, name=monster_id, stats=_EMPTY_STATS, ai="basic", skills=["__basic__"], gimmicks=[])
 
     def _fallback_boss(self, boss_id: str, is_special: bool = False) -> Boss:
         base = self._fallback_monster(boss_id)
@@ -435,15 +591,55 @@ class DataManager:
             is_special=is_special,
         )
 
+    def _fallback_special_boss(self, boss_id: str) -> Boss:
+        return self._fallback_boss(boss_id, is_special=True)
+
+    def _fallback_basic_skill(self) -> Skill:
+        return self._fallback_skill("__basic__", name="기본 공격", base_physical=10, scale_attack=0.2)
+
+    def _fallback_zone(self, zone_id: str) -> DungeonZone:
+        return DungeonZone(zone_id=zone_id)
+
     def _fallback_profile(self, player_id: str) -> PlayerProfile:
         return PlayerProfile(id=player_id, name=player_id, base_stats=Stats(max_hp=100), skills=["__basic__"])
 
     # --------------------
     # Low-level I/O (single choke point)
     # --------------------
-    def _safe_load_json(self, path: Path, ensure_exists: bool = False) -> Dict[str, Any]:
+    def _load_cached(self, path: Path, builder: Callable[[], T]) -> T:
+        """원본 JSON의 mtime/크기가 같으면 `<파일>.pkl`에서 모델 트리를 바로 복원합니다."""
+        with _gc_paused():
+            return self._load_cached_unpaused(path, builder)
+
+    def _load_cached_unpaused(self, path: Path, builder: Callable[[], T]) -> T:
+        try:
+            st = path.stat()
+        except OSError:
+            return builder()
+        stamp = (_PICKLE_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+        cache_path = path.with_suffix(path.suffix + ".pkl")
+        try:
+            with cache_path.open("rb") as f:
+                cached_stamp, data = pickle.load(f)
+            if cached_stamp == stamp:
+                return data
+        except FileNotFoundError:
+            pass
+        except Exception as exc:  # 손상/구버전 캐시는 다시 생성
+            self.log.warning("캐시 로드 실패(%s), 원본에서 다시 생성합니다: %s", cache_path, exc)
+        data = builder()
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            self.log.warning("캐시 저장 실패(%s): %s", cache_path, exc)
+        return data
+
+    def _safe_load_json(self, path: Path, ensure_exists: bool = False, use_cache: bool = True) -> Dict[str, Any]:
         try:
-            return self._load_json(path, ensure_exists=ensure_exists)
+            return self._load_json(path, ensure_exists=ensure_exists, use_cache=use_cache)
         except FileNotFoundError:
             self.log.warning("데이터 파일을 찾을 수 없습니다: %s", path)
             return {}
@@ -451,14 +647,22 @@ class DataManager:
             self.log.warning("JSON 파싱 오류(%s): %s", path, exc)
             return {}
 
-    def _load_json(self, path: Path, ensure_exists: bool = False) -> Dict[str, Any]:
+    def _load_json(self, path: Path, ensure_exists: bool = False, use_cache: bool = True) -> Dict[str, Any]:
         if ensure_exists and not path.exists():
             path.parent.mkdir(parents=True, exist_ok=True)
             return {"version": "0.0.0"}
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        if not use_cache:
+            return _read_json_file(path)
+        st = path.stat()
+        return _cached_parse(str(path), st.st_mtime_ns, st.st_size)
 
     def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # 한 번에 임시 파일로 쓰고 교체: 쓰는 도중 종료돼도 기존 파일이 깨지지 않음
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
@@ -1,8 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import AbstractSet, Any, Dict, List, Tuple
+
+try:  # 선택 의존성: 있으면 JSON 파싱을 orjson으로 처리
+    import orjson
+except ImportError:  # pragma: no cover - 표준 json으로 대체
+    orjson = None
+
+# 검증 결과 캐시: 데이터 파일 내용이 그대로면 파싱/검증을 건너뛴다
+# (bosses.json은 처음 필요할 때 따로 읽으므로 캐시/다이제스트 대상이 아니다)
+VALIDATED_CACHE_NAME = ".validated.pkl"
+_VALIDATED_CACHE_VERSION = 2
+_DATA_FILES = ("players.json", "skills.json", "monsters.json", "items.json")
+_CACHED_FIELDS = ("players", "default_player_id", "skills", "monsters", "items", "drop_tables")
+
+# 검증 규칙 상수 (엔트리마다 리스트/셋을 새로 만들지 않도록 모듈 레벨에 고정)
+_STAT_KEYS = ("attack", "magic", "defense", "magic_resist", "max_hp")
+_REQUIRED_SKILL_KEYS = ("name", "base_physical", "base_magic", "scale")
+_SKILL_SCALE_KEYS = ("attack", "magic")
+_SKILL_BASE_KEYS = ("base_physical", "base_magic")
+_ITEM_TYPES = frozenset({"equipment", "consumable", "material"})
+_EQUIPMENT_SLOTS = frozenset({"weapon", "armor", "accessory"})
+_USE_EFFECT_TYPES = frozenset({"heal", "cleanse", "buff_stats"})
+_ZONE_NUMBER = re.compile(r"\d+")
+_RARITY_ORDER = {"legendary": 0, "epic": 1, "rare": 2, "common": 3}
 
 
 class DataStore:
@@ -15,11 +43,31 @@ class DataStore:
         self.monsters: Dict[str, Any] = {}
         self.items: Dict[str, Any] = {}
         self.drop_tables: Dict[str, Any] = {}
-        self.bosses: Dict[str, Any] = {}
+        # bosses.json은 보스 전투/특수 보스 화면에서 처음 필요할 때 읽는다
+        self._bosses: Dict[str, Any] | None = None
+        self._bosses_path: Path | None = None
+        self._zone_to_boss: Dict[str, str] | None = None
+        # 던전/특수 보스를 합친 id 인덱스 (get_boss 첫 호출 때 만든다)
+        self._boss_index: Dict[str, Dict[str, Any]] | None = None
+        # 드랍 테이블별 (chance, item_id, 최소, 최대) 행: roll_drop이 처음 굴릴 때 만든다
+        self._drop_rows: Dict[str, Tuple[Tuple[Any, Any, int, int], ...]] = {}
+        # 아이템별 인벤토리 정렬 키 (등급 순위, 이름)
+        self._item_sort_keys: Dict[str, Tuple[int, str]] = {}
 
     def load_all(self, data_dir: Path) -> None:
         """players/skills/monsters/items JSON을 모두 읽고 검증한다."""
+        cache_path = data_dir / VALIDATED_CACHE_NAME
+        self._bosses_path = data_dir / "bosses.json"
+        self._bosses = None
+        self._zone_to_boss = None
+        self._boss_index = None
+        self._drop_rows = {}
+        self._item_sort_keys = {}
         try:
+            digests = self._data_digests(data_dir)
+            if self._load_validated_cache(cache_path, digests):
+                self._intern_ids()
+                return
             players_data = self._load_json(data_dir / "players.json")
             self.players = players_data.get("players", {})
             self.default_player_id = players_data.get("default_player_id")
@@ -30,21 +78,23 @@ class DataStore:
             self.items = items_data.get("items", {})
             self.drop_tables = items_data.get("drop_tables", {})
 
-            # bosses.json은 없을 수도 있으므로 실패 시 빈 dict
-            bosses_path = data_dir / "bosses.json"
-            if bosses_path.exists():
-                self.bosses = self._load_json(bosses_path)
-            else:
-                self.bosses = {}
-
             # 폴백 스킬 보장 후 스키마 검증
             self._ensure_basic_skill()
             self.validate_all()
+            self._intern_ids()
+            self._save_validated_cache(cache_path, digests)
         except FileNotFoundError as exc:
             raise RuntimeError(f"데이터 파일을 찾을 수 없습니다: {exc}") from exc
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"데이터 파일 파싱 오류: {exc}") from exc
 
+    @property
+    def bosses(self) -> Dict[str, Any]:
+        """bosses.json 전체. 첫 접근 시 로드하고 보스 스킬을 정리한다."""
+        if self._bosses is None:
+            self._bosses = self._load_bosses()
+        return self._bosses
+
     def get_player(self, player_id: str) -> Dict[str, Any]:
         """플레이어 데이터 조회. 없으면 KeyError 발생."""
         if player_id not in self.players:
@@ -69,7 +119,34 @@ class DataStore:
 
     def get_boss(self, boss_id: str) -> Dict[str, Any]:
         """보스 데이터 조회."""
-        return self.bosses.get("dungeon_bosses", {}).get(boss_id, {}) or self.bosses.get("special_bosses", {}).get(boss_id, {})
+        index = self._boss_index
+        if index is None:
+            # id가 겹치면 기존처럼 비어 있지 않은 던전 보스를 우선한다
+            index = dict(self.bosses.get("special_bosses") or {})
+            index.update((k, v) for k, v in (self.bosses.get("dungeon_bosses") or {}).items() if v)
+            self._boss_index = index
+        return index.get(boss_id) or {}
+
+    def get_drop_rows(self, table_name: str) -> Tuple[Tuple[Any, Any, int, int], ...]:
+        """드랍 테이블을 (chance, item_id, 최소 수량, 최대 수량) 튜플로 미리 풀어 둔다."""
+        rows = self._drop_rows.get(table_name)
+        if rows is None:
+            compiled = []
+            for entry in self.drop_tables.get(table_name, []):
+                qty_min = int(entry.get("min", 1))
+                qty_max = int(entry.get("max", qty_min))
+                lo, hi = (qty_min, qty_max) if qty_min <= qty_max else (qty_max, qty_min)
+                compiled.append((entry.get("chance", 0), entry.get("item"), lo, hi))
+            rows = self._drop_rows[table_name] = tuple(compiled)
+        return rows
+
+    def get_item_sort_key(self, item_id: str) -> Tuple[int, str]:
+        """인벤토리 정렬 키(rarity>name)를 아이템마다 한 번만 계산한다."""
+        key = self._item_sort_keys.get(item_id)
+        if key is None:
+            data = self.items.get(item_id) or {}
+            key = self._item_sort_keys[item_id] = (_RARITY_ORDER.get(data.get("rarity"), 4), data.get("name", item_id))
+        return key
 
     def get_special_boss_ids(self) -> List[str]:
         """특수 보스 ID 목록."""
@@ -82,33 +159,39 @@ class DataStore:
         bosses = self.bosses.get("dungeon_bosses", {})
         if candidate in bosses:
             return candidate
-        # 보스 id가 zone 숫자만으로도 있을 수 있으니 탐색
-        for key in bosses.keys():
-            if zid in key:
-                return key
-        return None
+        if self._zone_to_boss is None:
+            # 보스 id가 zone 숫자만으로도 있을 수 있으니 id의 첫 숫자로 존 인덱스를 한 번만 만든다
+            index: Dict[str, str] = {}
+            for key in bosses:
+                match = _ZONE_NUMBER.search(key)
+                if match:
+                    index.setdefault(match.group(), key)
+            self._zone_to_boss = index
+        return self._zone_to_boss.get(zid)
 
     # ------------------------------------------------------------------
     # 검증/정리 로직
     # ------------------------------------------------------------------
     def validate_all(self) -> None:
         """players/skills/monsters JSON 스키마 검증 및 스킬 정리."""
+        # 액터 스킬 정리에 쓸 스킬 키 집합은 한 번만 만든다
+        skill_keys = frozenset(self.skills)
+
         # skills.json 검증
         for skill_id, skill in self.skills.items():
-            required_skill_keys = ["name", "base_physical", "base_magic", "scale"]
-            for key in required_skill_keys:
+            for key in _REQUIRED_SKILL_KEYS:
                 if key not in skill:
                     raise ValueError(f"skills.json: skill '{skill_id}'에 '{key}'가 없습니다.")
             if not isinstance(skill.get("scale", {}), dict):
                 raise ValueError(f"skills.json: skill '{skill_id}'의 scale이 객체가 아닙니다.")
-            for scale_key in ["attack", "magic"]:
+            for scale_key in _SKILL_SCALE_KEYS:
                 if scale_key not in skill["scale"]:
                     raise ValueError(f"skills.json: skill '{skill_id}'의 scale.{scale_key}가 없습니다.")
                 if not isinstance(skill["scale"][scale_key], (int, float)):
                     raise ValueError(
                         f"skills.json: skill '{skill_id}'의 scale.{scale_key} 값이 숫자가 아닙니다: {skill['scale'][scale_key]}"
                     )
-            for num_key in ["base_physical", "base_magic"]:
+            for num_key in _SKILL_BASE_KEYS:
                 if not isinstance(skill.get(num_key), (int, float)):
                     raise ValueError(
                         f"skills.json: skill '{skill_id}'의 {num_key} 값이 숫자가 아닙니다: {skill.get(num_key)}"
@@ -119,7 +202,7 @@ class DataStore:
             raise ValueError(f"players.json: default_player_id '{self.default_player_id}'가 players에 없습니다.")
         for player_id, player in self.players.items():
             base_stats = player.get("base_stats", {})
-            for key in ["attack", "magic", "defense", "magic_resist", "max_hp"]:
+            for key in _STAT_KEYS:
                 if key not in base_stats:
                     raise ValueError(f"players.json: player '{player_id}'의 base_stats에 '{key}'가 없습니다.")
                 if not isinstance(base_stats[key], (int, float)):
@@ -127,12 +210,12 @@ class DataStore:
                         f"players.json: player '{player_id}'의 base_stats.{key} 값이 숫자가 아닙니다: {base_stats[key]}"
                     )
             skills = player.get("skills", [])
-            player["skills"] = self._sanitize_actor_skills(skills, f"player '{player_id}'")
+            player["skills"] = self._sanitize_actor_skills(skills, f"player '{player_id}'", skill_keys)
 
         # monsters.json 검증
         for monster_id, monster in self.monsters.items():
             stats = monster.get("stats", {})
-            for key in ["attack", "magic", "defense", "magic_resist", "max_hp"]:
+            for key in _STAT_KEYS:
                 if key not in stats:
                     raise ValueError(f"monsters.json: monster '{monster_id}'의 stats에 '{key}'가 없습니다.")
                 if not isinstance(stats[key], (int, float)):
@@ -140,21 +223,19 @@ class DataStore:
                         f"monsters.json: monster '{monster_id}'의 stats.{key} 값이 숫자가 아닙니다: {stats[key]}"
                     )
             skills = monster.get("skills", [])
-            monster["skills"] = self._sanitize_actor_skills(skills, f"monster '{monster_id}'")
+            # 적 스킬 풀은 전투 중 바뀌지 않으므로 비어 있지 않은 튜플로 고정
+            monster["skills"] = tuple(self._sanitize_actor_skills(skills, f"monster '{monster_id}'", skill_keys))
 
         # items.json 검증
-        allowed_types = {"equipment", "consumable", "material"}
-        allowed_slots = {"weapon", "armor", "accessory", None}
-        allowed_use_effect_types = {"heal", "cleanse", "buff_stats"}
         for item_id, item in self.items.items():
             itype = item.get("type")
-            if itype not in allowed_types:
+            if itype not in _ITEM_TYPES:
                 raise ValueError(f"items.json: item '{item_id}'의 type이 잘못되었습니다: {itype}")
 
             stats = item.get("stats", {}) or {}
             if not isinstance(stats, dict):
                 raise ValueError(f"items.json: item '{item_id}'의 stats가 객체가 아닙니다.")
-            for key in ["attack", "magic", "defense", "magic_resist", "max_hp"]:
+            for key in _STAT_KEYS:
                 if key not in stats:
                     raise ValueError(f"items.json: item '{item_id}'의 stats에 '{key}'가 없습니다.")
                 if not isinstance(stats[key], (int, float)):
@@ -164,16 +245,16 @@ class DataStore:
 
             if itype == "equipment":
                 slot = item.get("slot")
-                if slot not in {"weapon", "armor", "accessory"}:
+                if slot not in _EQUIPMENT_SLOTS:
                     raise ValueError(f"items.json: equipment '{item_id}'의 slot이 잘못되었습니다: {slot}")
             if itype == "consumable":
                 use_effect = item.get("use_effect")
                 if not isinstance(use_effect, dict):
                     raise ValueError(f"items.json: consumable '{item_id}'의 use_effect가 객체가 아닙니다.")
                 ue_type = use_effect.get("type")
-                if ue_type not in allowed_use_effect_types:
+                if ue_type not in _USE_EFFECT_TYPES:
                     raise ValueError(f"items.json: consumable '{item_id}'의 use_effect.type이 잘못되었습니다: {ue_type}")
-                if use_effect.get("target") not in {"self"}:
+                if use_effect.get("target") != "self":
                     raise ValueError(f"items.json: consumable '{item_id}'의 target은 self만 지원합니다.")
                 # cleanse/remove 검증
                 if ue_type == "cleanse":
@@ -190,6 +271,22 @@ class DataStore:
                 if item_id not in self.items:
                     raise ValueError(f"items.json: drop_table '{table_name}'가 존재하지 않는 아이템 '{item_id}'를 참조합니다.")
 
+    def _load_bosses(self) -> Dict[str, Any]:
+        # bosses.json은 없을 수도 있으므로 그때는 빈 dict
+        if self._bosses_path is None or not self._bosses_path.exists():
+            return {}
+        try:
+            bosses = self._load_json(self._bosses_path)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"데이터 파일 파싱 오류: {exc}") from exc
+        # 보스 스킬 정리 (몬스터와 같은 규칙)
+        skill_keys = frozenset(self.skills)
+        for group in ("dungeon_bosses", "special_bosses"):
+            for boss_id, boss in (bosses.get(group, {}) or {}).items():
+                skills = boss.get("skills", [])
+                boss["skills"] = tuple(self._sanitize_actor_skills(skills, f"boss '{boss_id}'", skill_keys))
+        return bosses
+
     def _ensure_basic_skill(self) -> None:
         """폴백 기본 공격 스킬을 강제로 보장."""
         self.skills["__basic__"] = {
@@ -203,12 +300,18 @@ class DataStore:
             "apply_effect": None,
         }
 
-    def _sanitize_actor_skills(self, skill_ids: List[str], actor_label: str) -> List[str]:
+    def _sanitize_actor_skills(
+        self, skill_ids: List[str], actor_label: str, skill_keys: AbstractSet[str] | None = None
+    ) -> List[str]:
         """존재하지 않는 스킬 제거 후 비면 기본공격 삽입."""
+        known = frozenset(self.skills) if skill_keys is None else skill_keys
+        if skill_ids and known.issuperset(skill_ids):
+            # 흔한 경우: 모든 스킬이 유효하면 원소별 검사/경고 없이 바로 반환
+            return [sys.intern(sid) for sid in skill_ids]
         sanitized: List[str] = []
         for sid in skill_ids:
-            if sid in self.skills:
-                sanitized.append(sid)
+            if sid in known:
+                sanitized.append(sys.intern(sid))
             else:
                 print(f"[경고] {actor_label}의 skill_id '{sid}'가 skills.json에 없어 제거했습니다.")
         if not sanitized:
@@ -216,6 +319,63 @@ class DataStore:
             print(f"[경고] {actor_label}의 스킬이 비어 기본 공격(__basic__)을 삽입했습니다.")
         return sanitized
 
+    def _intern_ids(self) -> None:
+        """ID 키와 참조 문자열을 intern해 조회 시 포인터 비교로 끝나게 한다."""
+        intern = sys.intern
+        self.players = {intern(k): v for k, v in self.players.items()}
+        self.skills = {intern(k): v for k, v in self.skills.items()}
+        self.monsters = {intern(k): v for k, v in self.monsters.items()}
+        self.items = {intern(k): v for k, v in self.items.items()}
+        self.drop_tables = {intern(k): v for k, v in self.drop_tables.items()}
+        for player in self.players.values():
+            player["skills"] = [intern(sid) for sid in player["skills"]]
+        for monster in self.monsters.values():
+            monster["skills"] = tuple(intern(sid) for sid in monster["skills"])
+            if isinstance(monster.get("drop_table"), str):
+                monster["drop_table"] = intern(monster["drop_table"])
+        for entries in self.drop_tables.values():
+            for entry in entries:
+                if isinstance(entry.get("item"), str):
+                    entry["item"] = intern(entry["item"])
+
+    def _data_digests(self, data_dir: Path) -> Dict[str, str]:
+        """검증 캐시 대상 데이터 파일별 sha256."""
+        digests: Dict[str, str] = {}
+        for name in _DATA_FILES:
+            path = data_dir / name
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                # hashlib.file_digest는 3.11+ 전용이라 직접 나눠 읽는다 (3.10 지원)
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+            digests[name] = digest.hexdigest()
+        return digests
+
+    def _load_validated_cache(self, cache_path: Path, digests: Dict[str, str]) -> bool:
+        try:
+            with open(cache_path, "rb") as f:
+                version, cached_digests, fields = pickle.load(f)
+        except Exception:  # 없거나 손상된 캐시는 무시하고 다시 검증
+            return False
+        if version != _VALIDATED_CACHE_VERSION or cached_digests != digests:
+            return False
+        for name in _CACHED_FIELDS:
+            setattr(self, name, fields[name])
+        return True
+
+    def _save_validated_cache(self, cache_path: Path, digests: Dict[str, str]) -> None:
+        fields = {name: getattr(self, name) for name in _CACHED_FIELDS}
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((_VALIDATED_CACHE_VERSION, digests, fields), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            print(f"[경고] 검증 캐시 저장 실패: {exc}")
+
     def _load_json(self, path: Path) -> Dict[str, Any]:
+        if orjson is not None:
+            # orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스라 load_all의 예외 처리가 그대로 적용됨
+            return orjson.loads(path.read_bytes())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -1,28 +1,47 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class DungeonProgress:
-    """던전 해금 상태."""
+    """던전 해금 상태. (구역 번호는 내부에서 int로 두고, 저장/UI 경계에서만 문자열로 바꾼다)"""
 
-    unlocked_zones: List[str] = field(default_factory=lambda: ["1"])
-    unlocked_stage_by_zone: Dict[str, int] = field(default_factory=lambda: {"1": 1})
+    unlocked_zones: List[int] = field(default_factory=lambda: [1])
+    unlocked_stage_by_zone: Dict[int, int] = field(default_factory=lambda: {1: 1})
 
-    def is_stage_unlocked(self, zone: str, stage: int) -> bool:
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "DungeonProgress":
+        """세이브의 dungeon_progress 블록("1" 같은 문자열 키)을 int 키로 변환."""
+        zones = raw.get("unlocked_zones", ["1"])
+        stages = raw.get("unlocked_stage_by_zone", {"1": 1})
+        return cls(
+            unlocked_zones=[int(z) for z in zones],
+            unlocked_stage_by_zone={int(z): int(s) for z, s in stages.items()},
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """세이브 JSON 형식(문자열 구역 키)으로 변환."""
+        return {
+            "unlocked_zones": [str(z) for z in self.unlocked_zones],
+            "unlocked_stage_by_zone": {str(z): s for z, s in self.unlocked_stage_by_zone.items()},
+        }
+
+    def is_stage_unlocked(self, zone: int | str, stage: int) -> bool:
+        zone = int(zone)
         if zone not in self.unlocked_zones:
             return False
         return stage <= self.unlocked_stage_by_zone.get(zone, 0)
 
-    def clear_stage(self, zone: str, stage: int) -> None:
+    def clear_stage(self, zone: int | str, stage: int) -> None:
+        zone = int(zone)
         current = self.unlocked_stage_by_zone.get(zone, 1)
         if stage >= current:
             self.unlocked_stage_by_zone[zone] = min(5, stage + 1)
         # 5스테이지 클리어 시 다음 구역 해금
         if stage >= 5:
-            next_zone = str(int(zone) + 1)
-            if next_zone not in self.unlocked_zones and int(next_zone) <= 10:
+            next_zone = zone + 1
+            if next_zone not in self.unlocked_zones and next_zone <= 10:
                 self.unlocked_zones.append(next_zone)
                 self.unlocked_stage_by_zone[next_zone] = 1
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+from .entities import Actor
 
-@dataclass
+
+@dataclass(slots=True)
 class EffectInstance:
     """전투 한정 상태이상/버프 정보를 담는 인스턴스."""
 
@@ -21,41 +24,83 @@ class EffectInstance:
         return self.kind
 
 
-def roll_chance(chance: float, rng=random) -> bool:
-    """확률 굴림 헬퍼."""
-    return rng.random() <= chance
+@dataclass(frozen=True, slots=True)
+class EffectSpec:
+    """apply_effect 사양을 미리 풀어 둔 불변 레코드. (스킬 로드 시 한 번 생성)"""
+
+    kind: Optional[str]
+    chance: float = 1.0
+    duration: int = 0
+    power: float = 0.0
+    stats: Tuple[Tuple[str, int], ...] = ()
+    source: Optional[str] = None
+    target: str = "self"
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, object]) -> "EffectSpec":
+        return cls(
+            kind=spec.get("type") or spec.get("effect"),
+            chance=float(spec.get("chance", 1.0)),
+            duration=int(spec.get("duration", 0)),
+            power=float(spec.get("power", 0)),
+            stats=tuple((k, int(v)) for k, v in (spec.get("stats") or {}).items()),
+            source=spec.get("note") or spec.get("source"),
+            target=spec.get("target", "self"),
+        )
+
+
+def roll_chance(chance: float, rng=random, rng_random: Optional[Callable[[], float]] = None) -> bool:
+    """확률 굴림 헬퍼. (반복 호출하는 쪽은 rng.random을 미리 묶어 rng_random으로 넘긴다)"""
+    return (rng_random or rng.random)() <= chance
 
 
 def has_effect(target, effect_kind: str) -> bool:
     """특정 효과가 남아 있는지 확인."""
-    return any(e.kind == effect_kind and e.duration > 0 for e in getattr(target, "effects", []))
+    if isinstance(target, Actor):
+        return target.has_effect(effect_kind)
+    try:
+        effects = target.effects
+    except AttributeError:
+        return False
+    return any(e.kind == effect_kind and e.duration > 0 for e in effects)
 
 
 def _target_max_hp(target, items=None) -> int:
-    """대상의 최대 HP를 안전하게 얻는다."""
-    if hasattr(target, "get_total_stats"):
-        try:
-            stats = target.get_total_stats(items) if items is not None else target.get_total_stats()
-            return stats.max_hp if stats else getattr(target, "stats", None).max_hp
-        except TypeError:
-            stats = target.get_total_stats()
-            return stats.max_hp if stats else getattr(target, "stats", None).max_hp
-    if hasattr(target, "stats"):
-        return getattr(target.stats, "max_hp", 0)
-    return getattr(target, "hp", 0)
-
-
-def apply_effect(target, effect_spec: Dict[str, object], logs: List[str], rng=random, items=None) -> None:
-    """스킬 정의의 apply_effect 사양을 실제 인스턴스로 부여한다."""
-    if not hasattr(target, "effects"):
+    """대상의 최대 HP를 얻는다. (총합 스탯 → 기본 스탯 → 현재 HP 순)"""
+    getter = getattr(target, "get_total_stats", None)
+    if getter is None:
+        return getattr(getattr(target, "stats", None), "max_hp", getattr(target, "hp", 0))
+    stats = getter(items)
+    return stats.max_hp if stats else target.stats.max_hp
+
+
+def _add_effect(target, inst: EffectInstance) -> None:
+    """Actor면 add_effect로 추가해 종류별 개수/스탯 캐시 버전을 함께 갱신한다."""
+    if isinstance(target, Actor):
+        target.add_effect(inst)
+    else:
+        target.effects.append(inst)
+
+
+def _set_effects(target, effects: List[EffectInstance]) -> None:
+    if isinstance(target, Actor):
+        target.set_effects(effects)
+    else:
+        target.effects = effects
+
+
+def apply_effect(target, effect_spec: Union[EffectSpec, Dict[str, object]], logs: List[str], rng=random, items=None) -> None:
+    """스킬 정의의 apply_effect 사양을 실제 인스턴스로 부여한다. (EffectSpec 또는 원본 dict)"""
+    if not isinstance(target, Actor) and not hasattr(target, "effects"):
         return
 
-    effect_type = effect_spec.get("type") or effect_spec.get("effect")
-    chance = float(effect_spec.get("chance", 1.0))
-    duration = int(effect_spec.get("duration", 0))
-    power = float(effect_spec.get("power", 0))
-    stats_delta = {k: int(v) for k, v in (effect_spec.get("stats") or {}).items()}
-    source = effect_spec.get("note") or effect_spec.get("source")
+    spec = effect_spec if isinstance(effect_spec, EffectSpec) else EffectSpec.from_dict(effect_spec)
+    effect_type = spec.kind
+    chance = spec.chance
+    duration = spec.duration
+    power = spec.power
+    stats_delta = dict(spec.stats)
+    source = spec.source
 
     if chance < 1.0 and not roll_chance(chance, rng):
         logs.append("효과 실패!")
@@ -65,7 +110,8 @@ def apply_effect(target, effect_spec: Dict[str, object], logs: List[str], rng=ra
     if effect_type == "heal":
         before = getattr(target, "hp", 0)
         max_hp = _target_max_hp(target, items=items)
-        target.hp = min(max_hp, before + int(power))
+        healed = before + int(power)
+        target.hp = max_hp if max_hp <= healed else healed
         logs.append(f"{getattr(target, 'name', '대상')} 체력 회복 +{int(power)}")
         return
 
@@ -77,24 +123,24 @@ def apply_effect(target, effect_spec: Dict[str, object], logs: List[str], rng=ra
     inst = EffectInstance(kind=str(effect_type), duration=duration, power=power, stats_delta=stats_delta, source=source)
 
     if effect_type == "buff_stats":
-        target.effects.append(inst)
-        delta_text = _format_stats_delta(stats_delta, positive=True)
+        _add_effect(target, inst)
+        delta_text = _format_stats_pairs(spec.stats, True)
         logs.append(f"{getattr(target, 'name', '대상')}에게 버프: {delta_text} ({duration}턴)")
         return
 
     if effect_type == "debuff_stats":
-        target.effects.append(inst)
-        delta_text = _format_stats_delta(stats_delta, positive=False)
+        _add_effect(target, inst)
+        delta_text = _format_stats_pairs(spec.stats, False)
         logs.append(f"{getattr(target, 'name', '대상')}에게 약화: {delta_text} ({duration}턴)")
         return
 
     if effect_type == "bleed":
-        target.effects.append(inst)
+        _add_effect(target, inst)
         logs.append(f"{getattr(target, 'name', '대상')}에게 출혈 부여! ({duration}턴)")
         return
 
     if effect_type == "stun":
-        target.effects.append(inst)
+        _add_effect(target, inst)
         logs.append(f"{getattr(target, 'name', '대상')} 기절! ({duration}턴)")
         return
 
@@ -102,52 +148,62 @@ def apply_effect(target, effect_spec: Dict[str, object], logs: List[str], rng=ra
     logs.append(f"알 수 없는 효과: {effect_type}")
 
 
-def _format_stats_delta(stats_delta: Dict[str, int], positive: bool) -> str:
-    """스탯 증감 요약 텍스트 생성."""
-    name_map = {
-        "attack": "공격",
-        "magic": "마법",
-        "defense": "방어",
-        "magic_resist": "마저",
-        "max_hp": "체력",
-    }
+_STAT_LABELS = (
+    ("attack", "공격"),
+    ("magic", "마법"),
+    ("defense", "방어"),
+    ("magic_resist", "마저"),
+    ("max_hp", "체력"),
+)
+
+
+@lru_cache(maxsize=256)
+def _format_stats_pairs(pairs: Tuple[Tuple[str, int], ...], positive: bool) -> str:
+    """스탯 증감 요약 텍스트 생성. (스탯, 증감) 쌍 모양별로 한 번만 만든다."""
+    stats_delta = dict(pairs)
     parts: List[str] = []
-    for key in ["attack", "magic", "defense", "magic_resist", "max_hp"]:
+    for key, label in _STAT_LABELS:
         if key not in stats_delta:
             continue
         val = stats_delta[key]
         sign = "+" if val >= 0 else ""
-        parts.append(f"{name_map.get(key, key)} {sign}{val}")
+        parts.append(f"{label} {sign}{val}")
     return "/".join(parts) if parts else ("증가" if positive else "감소")
 
 
 def tick_end_of_turn(target, logs: List[str]) -> None:
     """턴 종료 시 bleed 틱과 지속 감소를 처리."""
-    if not hasattr(target, "effects"):
+    if not isinstance(target, Actor) and not hasattr(target, "effects"):
         return
-    remaining: List[EffectInstance] = []
-    for effect in list(target.effects):
+    effects = target.effects
+    # 남는 효과를 앞으로 당겨 제자리에서 압축 (만료가 없으면 새 리스트를 만들지 않는다)
+    write = 0
+    for effect in effects:
         if effect.kind == "bleed":
             before = getattr(target, "hp", 0)
-            target.hp = max(0, before - effect.power)
+            hp = before - effect.power
+            target.hp = hp if hp > 0 else 0
             logs.append(f"{getattr(target, 'name', '대상')} 출혈 피해 {effect.power} (HP {before}->{target.hp})")
         effect.duration -= 1
         if effect.duration > 0:
-            remaining.append(effect)
+            effects[write] = effect
+            write += 1
         else:
             logs.append(f"{getattr(target, 'name', '대상')}의 {effect.kind} 종료")
-    target.effects = remaining
+    if write != len(effects):
+        del effects[write:]
+        _set_effects(target, effects)
 
 
 def clear_all_battle_effects(target) -> None:
     """전투 종료 시 효과를 모두 제거."""
-    if hasattr(target, "effects"):
-        target.effects = []
+    if getattr(target, "effects", None):
+        _set_effects(target, [])
 
 
 def can_act(target, logs: List[str]) -> bool:
     """스턴이면 행동 불가 로그를 남기고 False 반환."""
-    if has_effect(target, "stun"):
+    if target.is_stunned() if isinstance(target, Actor) else has_effect(target, "stun"):
         logs.append(f"{getattr(target, 'name', '대상')}은(는) 기절해 움직일 수 없다!")
         return False
     return True
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:  # 순환 참조 방지용 타입 체크
     from .effects import EffectInstance
 
+_STAT_KEYS = ("attack", "magic", "defense", "magic_resist", "max_hp")
 
-@dataclass
+# 효과 종류별 비트 (Actor._effects_mask용). 처음 보는 종류는 effect_bit가 다음 비트를 배정
+EFFECT_BITS: Dict[str, int] = {"stun": 1, "bleed": 2, "buff_stats": 4, "debuff_stats": 8}
+STUN_BIT = EFFECT_BITS["stun"]
+
+
+def effect_bit(kind: str) -> int:
+    bit = EFFECT_BITS.get(kind)
+    if bit is None:
+        bit = EFFECT_BITS[kind] = 1 << len(EFFECT_BITS)
+    return bit
+
+
+@dataclass(frozen=True, slots=True)
 class Stats:
-    """공격/마법/방어/마법저항/체력 스탯."""
+    """공격/마법/방어/마법저항/체력 스탯. (불변이므로 여러 곳에서 공유해도 안전)"""
 
     attack: int = 0
     magic: int = 0
@@ -37,18 +50,18 @@ class Stats:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BattleResult:
-    """전투 결과."""
+    """전투 결과. (생성 후 변경하지 않음)"""
 
     winner: str  # "player" 또는 "enemy"
     exp: int = 0
     drops: List[str] = field(default_factory=list)  # 표시용 문자열
     drop_details: List[tuple[str, int]] = field(default_factory=list)  # (item_id, qty)
-    logs: List[str] = field(default_factory=list)
+    logs: List[object] = field(default_factory=list)  # 문자열 또는 (코드, 인자...) 튜플, combat.render_logs로 표시
 
 
-@dataclass
+@dataclass(slots=True)
 class Actor:
     """플레이어/적 공통 속성."""
 
@@ -57,31 +70,71 @@ class Actor:
     hp: int = 0
     skills: List[str] = field(default_factory=list)
     effects: List["EffectInstance"] = field(default_factory=list)
+    # effects 목록이 바뀔 때마다 증가 (add_effect/set_effects로만 변경)
+    _effects_version: int = field(default=0, init=False, repr=False, compare=False)
+    # 남은 지속시간이 있는 효과 종류의 비트 집합: has_effect를 비트 검사 한 번으로 판정
+    _effects_mask: int = field(default=0, init=False, repr=False, compare=False)
+    # (_effects_version, 버프/디버프 합산) 캐시: 효과 목록이 바뀌기 전까지 재사용
+    _bonus_cache: Optional[Tuple[int, Dict[str, int]]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.hp <= 0:
             self.hp = self.stats.max_hp
+        if self.effects:
+            self.set_effects(self.effects)
+
+    def add_effect(self, effect: "EffectInstance") -> None:
+        """효과를 목록 끝에 추가. (적용 순서가 틱/로그 순서이므로 목록은 유지)"""
+        self.effects.append(effect)
+        if effect.duration > 0:
+            self._effects_mask |= effect_bit(effect.kind)
+        self._effects_version += 1
+
+    def set_effects(self, effects: List["EffectInstance"]) -> None:
+        """효과 목록을 교체하고 남은 효과로 비트 집합을 다시 만든다."""
+        mask = 0
+        for eff in effects:
+            if eff.duration > 0:
+                mask |= effect_bit(eff.kind)
+        self.effects = effects
+        self._effects_mask = mask
+        self._effects_version += 1
+
+    def has_effect(self, kind: str) -> bool:
+        bit = EFFECT_BITS.get(kind)
+        return bit is not None and self._effects_mask & bit != 0
+
+    def is_stunned(self) -> bool:
+        return self._effects_mask & STUN_BIT != 0
 
     def apply_damage(self, amount: int) -> None:
-        self.hp = max(0, self.hp - amount)
+        # 전투마다 수백 번 호출되므로 max/min 내장 호출 대신 조건식으로 클램프
+        hp = self.hp - amount
+        self.hp = hp if hp > 0 else 0
 
     def heal(self, amount: int) -> None:
-        self.hp = min(self.stats.max_hp, self.hp + amount)
+        max_hp = self.stats.max_hp
+        hp = self.hp + amount
+        self.hp = max_hp if max_hp <= hp else hp
 
     def _effect_bonus(self) -> Dict[str, int]:
-        """버프/디버프 지속 효과에서 스탯 보정치를 합산."""
+        """버프/디버프 지속 효과에서 스탯 보정치를 합산. (반환 dict는 캐시이므로 수정 금지)"""
+        cached = self._bonus_cache
+        if cached is not None and cached[0] == self._effects_version:
+            return cached[1]
         bonus: Dict[str, int] = {}
-        for eff in getattr(self, "effects", []):
-            if getattr(eff, "duration", 0) <= 0:
+        for eff in self.effects:
+            if eff.duration <= 0:
                 continue
             if eff.kind not in ("buff_stats", "debuff_stats"):
                 continue
             for key, val in (eff.stats_delta or {}).items():
                 bonus[key] = bonus.get(key, 0) + int(val)
+        self._bonus_cache = (self._effects_version, bonus)
         return bonus
 
     def get_total_stats(self, items: Optional[Dict[str, object]] = None) -> Stats:
-        """적 전용 기본 스탯 + 효과 버프를 반환."""
+        """적 전용 기본 스탯 + 효과 버프를 반환. (items는 Player와 시그니처를 맞추기 위한 것으로 무시)"""
         base = self.stats
         eff_bonus = self._effect_bonus()
         return base.with_bonus(eff_bonus)
@@ -99,7 +152,7 @@ class Actor:
         return self.hp <= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Player(Actor):
     """플레이어 상태."""
 
@@ -112,10 +165,14 @@ class Player(Actor):
     equipment: Dict[str, Optional[str]] = field(default_factory=dict)
     allocated_stats: Dict[str, int] = field(default_factory=dict)
     base_stats: Stats = field(default_factory=Stats)
+    # total_stats 캐시: ((장비 버전, 효과 버전), items, 결과). 장비/스탯분배 변경 시 invalidate_stats로 버전을 올린다.
+    _stats_version: int = field(default=0, init=False, repr=False, compare=False)
+    _stats_cache: Optional[Tuple[Tuple[int, int], object, Stats]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        super().__post_init__()
-        # 구버전 리스트 인벤을 dict로 자동 변환
+        # slots 데이터클래스는 클래스가 재생성되어 인자 없는 super()를 쓸 수 없다.
+        Actor.__post_init__(self)
+        # 구버전 리스트 인벤을 dict로 자동 변환 (이후 인벤토리 헬퍼는 dict라고 가정)
         if isinstance(self.inventory, list):
             migrated: Dict[str, int] = {}
             for item_id in self.inventory:
@@ -126,38 +183,56 @@ class Player(Actor):
         if not self.equipment:
             self.equipment = {"weapon": None, "armor": None, "accessory": None}
 
+    def invalidate_stats(self) -> None:
+        """장비/스탯분배가 바뀌었음을 알려 total_stats 캐시를 무효화."""
+        self._stats_version += 1
+
     def total_stats(self, items: Optional[object] = None) -> Stats:
+        """장비/스탯분배/전투 버프가 반영된 총합 스탯.
+
+        장비/효과 버전과 items가 같으면 계산 결과를 재사용한다.
+        """
+        key = (self._stats_version, self._effects_version)
+        cached = self._stats_cache
+        if cached is not None and cached[0] == key and cached[1] is items:
+            return cached[2]
+        result = self._compute_total_stats(items)
+        self._stats_cache = (key, items, result)
+        return result
+
+    def _compute_total_stats(self, items: Optional[object] = None) -> Stats:
         """장비/스탯분배/전투 버프가 반영된 총합 스탯 계산."""
         bonus: Dict[str, int] = {k: int(v) for k, v in self.allocated_stats.items()}
+        # 장비 특수효과 stat_multiplier 가 있을 때만 만든다 (없으면 곱연산 단계 생략)
+        multipliers: Optional[Dict[str, float]] = None
         resolver = None
         if items:
             # data_store 인스턴스 또는 dict 모두 지원
             resolver = items.get if hasattr(items, "get") else None
             if hasattr(items, "get_item"):
                 resolver = items.get_item
-        for slot, item_id in self.equipment.items():
+        # 장비는 한 번만 순회하며 가산 스탯과 곱연산 배율을 함께 모은다
+        for item_id in self.equipment.values():
             if not item_id:
                 continue
             item_obj = resolver(item_id) if resolver else None
             if not item_obj:
                 continue
-            stats_dict = item_obj.get("stats", {}) if isinstance(item_obj, dict) else getattr(item_obj, "stats", {})
+            if isinstance(item_obj, dict):
+                stats_dict = item_obj.get("stats", {})
+                special = item_obj.get("special")
+            else:
+                stats_dict = getattr(item_obj, "stats", {})
+                special = getattr(item_obj, "special", None)
             for key, value in stats_dict.items():
                 bonus[key] = bonus.get(key, 0) + int(value)
-
-        # 장비 특수효과: stat_multiplier 는 스탯을 곱연산으로 강화 (예: 주문력 20% 증가)
-        multipliers: Dict[str, float] = {k: 1.0 for k in ["attack", "magic", "defense", "magic_resist", "max_hp"]}
-        for slot, item_id in self.equipment.items():
-            if not item_id:
-                continue
-            item_obj = resolver(item_id) if resolver else None
-            if not item_obj:
-                continue
-            special = item_obj.get("special") if isinstance(item_obj, dict) else getattr(item_obj, "special", None)
+            # 장비 특수효과: stat_multiplier 는 스탯을 곱연산으로 강화 (예: 주문력 20% 증가)
             if isinstance(special, dict) and special.get("type") == "stat_multiplier":
                 stat_key = special.get("stat")
                 mult = float(special.get("mult", 1.0))
-                if stat_key in multipliers and mult > 0:
+                if stat_key in _STAT_KEYS and mult > 0:
+                    if multipliers is None:
+                        multipliers = dict.fromkeys(_STAT_KEYS, 1.0)
                     multipliers[stat_key] *= mult
 
         # 전투 한정 버프/디버프 합산
@@ -165,6 +240,8 @@ class Player(Actor):
             bonus[key] = bonus.get(key, 0) + val
 
         base = self.base_stats.with_bonus(bonus)
+        if multipliers is None:
+            return base
         # 곱연산 적용 후 최종 Stats 생성
         return Stats(
             attack=int(base.attack * multipliers["attack"]),
@@ -184,7 +261,7 @@ class Player(Actor):
         self.hp = min(self.hp, max_hp)
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy(Actor):
     """적/보스 정보."""
 
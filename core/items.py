@@ -5,13 +5,18 @@ from __future__ import annotations
 표준 라이브러리만 사용하며 전투와 UI에서 공통 호출할 수 있도록 구성한다.
 """
 
+import sys
 from typing import Dict, List, Tuple
 
 from . import effects
 
 
 def _ensure_inventory_dict(player_or_inv) -> Dict[str, int]:
-    """플레이어 또는 인벤 오브젝트를 dict 형태로 강제 변환."""
+    """플레이어 또는 인벤 오브젝트를 dict 형태로 강제 변환.
+
+    세이브 로드 같은 경계에서 구버전 입력을 받을 때만 쓴다. Player는 생성 시 이미 dict로 맞춰지므로
+    아래 헬퍼들은 player.inventory를 바로 사용한다.
+    """
     inv = player_or_inv if isinstance(player_or_inv, dict) else getattr(player_or_inv, "inventory", {})
     if isinstance(inv, list):
         migrated: Dict[str, int] = {}
@@ -30,13 +35,14 @@ def _ensure_inventory_dict(player_or_inv) -> Dict[str, int]:
 
 def add_item_to_inventory(player, item_id: str, qty: int = 1) -> None:
     """지정 수량만큼 인벤토리에 추가."""
-    inv = _ensure_inventory_dict(player)
+    inv = player.inventory
+    item_id = sys.intern(item_id)
     inv[item_id] = inv.get(item_id, 0) + max(1, int(qty))
 
 
 def remove_item_from_inventory(player, item_id: str, qty: int = 1) -> bool:
     """수량 차감. 부족하면 False 반환."""
-    inv = _ensure_inventory_dict(player)
+    inv = player.inventory
     need = max(1, int(qty))
     if inv.get(item_id, 0) < need:
         return False
@@ -48,7 +54,7 @@ def remove_item_from_inventory(player, item_id: str, qty: int = 1) -> bool:
 
 def equip_item(player, item_id: str, data_store) -> Tuple[bool, str]:
     """장비 장착 처리."""
-    inv = _ensure_inventory_dict(player)
+    inv = player.inventory
     item = data_store.get_item(item_id)
     if not item:
         return False, "아이템을 찾을 수 없습니다."
@@ -85,11 +91,16 @@ def unequip_slot(player, slot: str, data_store) -> Tuple[bool, str]:
 
 def list_inventory_entries(player, data_store) -> List[Dict[str, object]]:
     """UI용 인벤토리 엔트리 목록."""
-    inv = _ensure_inventory_dict(player)
+    inv = player.inventory
+    # 정렬: rarity>name (키는 DataStore가 아이템별로 캐시)
+    sort_key = getattr(data_store, "get_item_sort_key", None)
+    if sort_key is not None:
+        item_ids = sorted((item_id for item_id, count in inv.items() if count > 0), key=sort_key)
+    else:
+        item_ids = sorted((item_id for item_id, count in inv.items() if count > 0), key=lambda i: _fallback_sort_key(i, data_store))
     entries: List[Dict[str, object]] = []
-    for item_id, count in inv.items():
-        if count <= 0:
-            continue
+    for item_id in item_ids:
+        count = inv[item_id]
         data = data_store.get_item(item_id) or {}
         entries.append(
             {
@@ -101,12 +112,16 @@ def list_inventory_entries(player, data_store) -> List[Dict[str, object]]:
                 "desc": data.get("desc") or data.get("description"),
             }
         )
-    # 정렬: rarity>name
-    rarity_order = {"legendary": 0, "epic": 1, "rare": 2, "common": 3, None: 4}
-    entries.sort(key=lambda e: (rarity_order.get(e.get("rarity"), 4), e.get("name", "")))
     return entries
 
 
+def _fallback_sort_key(item_id: str, data_store) -> Tuple[int, str]:
+    """get_item_sort_key가 없는 저장소용 정렬 키."""
+    data = data_store.get_item(item_id) or {}
+    rarity_order = {"legendary": 0, "epic": 1, "rare": 2, "common": 3, None: 4}
+    return rarity_order.get(data.get("rarity"), 4), data.get("name", item_id)
+
+
 def apply_consumable_in_battle(player, item_id: str, data_store, logs: List[str]) -> Tuple[bool, str]:
     """전투 중 소모품 사용 처리."""
     item = data_store.get_item(item_id) if hasattr(data_store, "get_item") else None
@@ -123,17 +138,18 @@ def apply_consumable_in_battle(player, item_id: str, data_store, logs: List[str]
         power = int(effect.get("power", 0))
         before = player.hp
         max_hp = player.get_total_stats(data_store.items).max_hp
-        player.hp = min(max_hp, player.hp + power)
+        healed = player.hp + power
+        player.hp = max_hp if max_hp <= healed else healed
         logs.append(f"체력 +{power} 회복! (HP {before}->{player.hp})")
         return True, "회복 완료"
 
     # cleanse
     if effect_type == "cleanse":
         remove_list = effect.get("remove", []) or []
-        before_count = len(player.effects)
-        player.effects = [eff for eff in player.effects if getattr(eff, "kind", None) not in remove_list]
-        removed = before_count - len(player.effects)
+        kept = [eff for eff in player.effects if getattr(eff, "kind", None) not in remove_list]
+        removed = len(player.effects) - len(kept)
         if removed > 0:
+            player.set_effects(kept)
             logs.append("/".join(remove_list) + " 해제!")
             return True, "해제 완료"
         logs.append("해제할 상태이상이 없습니다.")
@@ -7,14 +7,24 @@ from typing import List, Tuple
 def roll_drop(table_name: str, data_store, rng=random) -> List[Tuple[str, int]]:
     """드랍 테이블을 굴려 (아이템ID, 수량) 목록을 반환."""
     results: List[Tuple[str, int]] = []
+    # 엔트리마다 속성 조회하지 않도록 메서드를 미리 묶어 둔다
+    rand = rng.random
+    randint = rng.randint
+    get_rows = getattr(data_store, "get_drop_rows", None)
+    if get_rows is not None:
+        # DataStore가 미리 풀어 둔 행을 사용 (엔트리마다 dict 조회/int 변환 생략)
+        for chance, item_id, qty_lo, qty_hi in get_rows(table_name):
+            if rand() <= chance and item_id:
+                results.append((item_id, randint(qty_lo, qty_hi)))
+        return results
     table = (getattr(data_store, "drop_tables", {}) or {}).get(table_name, [])
     for entry in table:
         chance = entry.get("chance", 0)
-        if rng.random() <= chance:
+        if rand() <= chance:
             item_id = entry.get("item")
             if item_id:
                 qty_min = int(entry.get("min", 1))
                 qty_max = int(entry.get("max", qty_min))
-                qty = rng.randint(min(qty_min, qty_max), max(qty_min, qty_max))
+                qty = randint(min(qty_min, qty_max), max(qty_min, qty_max))
                 results.append((item_id, qty))
     return results
@@ -8,15 +8,16 @@ from __future__ import annotations
   런타임 의존성이 없어서 초기에 부담이 적기 때문입니다.
 """
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 # --------------------
 # 공통 자료형
 # --------------------
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Stats:
     attack: int = 0
     magic: int = 0
@@ -24,14 +25,31 @@ class Stats:
     magic_resist: int = 0
     max_hp: int = 0
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "Stats":
+        """JSON stats 블록을 임시 dict/** 언패킹 없이 위치 인자로 바로 변환합니다."""
+        get = raw.get
+        return cls(
+            int(get("attack", 0)),
+            int(get("magic", 0)),
+            int(get("defense", 0)),
+            int(get("magic_resist", 0)),
+            int(get("max_hp", 0)),
+        )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillScale:
     attack: float = 0.0
     magic: float = 0.0
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "SkillScale":
+        get = raw.get
+        return cls(float(get("attack", 0.0)), float(get("magic", 0.0)))
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ItemSpecial:
     type: str
     chance: Optional[float] = None
@@ -42,7 +60,7 @@ class ItemSpecial:
     power: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UseEffect:
     type: str
     target: str = "self"
@@ -53,7 +71,7 @@ class UseEffect:
     scope: str = "battle"
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     id: str
     name: str
@@ -67,22 +85,30 @@ class Item:
     use_effect: Optional[UseEffect] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DropEntry:
     item: str
     chance: float
     min: int = 1
     max: int = 1
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "DropEntry":
+        get = raw.get
+        item = get("item", "")
+        if type(item) is str:
+            item = sys.intern(item)
+        return cls(item, float(get("chance", 0)), int(get("min", 1)), int(get("max", 1)))
 
-@dataclass
+
+@dataclass(slots=True)
 class ItemsData:
     version: str
     items: Dict[str, Item] = field(default_factory=dict)
     drop_tables: Dict[str, List[DropEntry]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillEffect:
     type: str
     target: str = "enemy"
@@ -92,8 +118,21 @@ class SkillEffect:
     stats: Dict[str, int] = field(default_factory=dict)
     scope: str = "battle"
 
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "SkillEffect":
+        get = raw.get
+        return cls(
+            get("type") or get("effect", "unknown"),
+            get("target", "enemy"),
+            float(get("chance", 1.0)),
+            int(get("duration", 0)),
+            float(get("power", 0.0)),
+            {k: int(v) for k, v in (get("stats") or {}).items()},
+            get("scope", "battle"),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     id: str
     name: str
@@ -106,13 +145,13 @@ class Skill:
     apply_effects: List[SkillEffect] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillsData:
     version: str
     skills: Dict[str, Skill] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Monster:
     id: str
     name: str
@@ -123,26 +162,26 @@ class Monster:
     drop_table: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Boss(Monster):
     drop_table: Optional[str] = None
     is_special: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MonstersData:
     version: str
     monsters: Dict[str, Monster] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BossesData:
     version: str
     dungeon_bosses: Dict[str, Boss] = field(default_factory=dict)
     special_bosses: Dict[str, Boss] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DungeonStage:
     stage_id: str
     monster_pool: List[str] = field(default_factory=list)
@@ -150,19 +189,34 @@ class DungeonStage:
     exp: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DungeonZone:
     zone_id: str
     stages: Dict[str, DungeonStage] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DungeonsData:
     version: str
     zones: Dict[str, DungeonZone] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
+class Equipment:
+    weapon: Optional[str] = None
+    armor: Optional[str] = None
+    accessory: Optional[str] = None
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "Equipment":
+        get = raw.get
+        return cls(get("weapon"), get("armor"), get("accessory"))
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"weapon": self.weapon, "armor": self.armor, "accessory": self.accessory}
+
+
+@dataclass(slots=True)
 class PlayerProgress:
     level: int = 1
     exp: int = 0
@@ -171,18 +225,18 @@ class PlayerProgress:
     allocated_stats: Dict[str, int] = field(default_factory=dict)
     hp: int = 0
     inventory: Dict[str, int] = field(default_factory=dict)
-    equipment: Dict[str, Optional[str]] = field(default_factory=lambda: {"weapon": None, "armor": None, "accessory": None})
+    equipment: Equipment = field(default_factory=Equipment)
     dungeon_progress: Dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SaveData:
     version: str
     selected_player_id: Optional[str]
     players: Dict[str, PlayerProgress] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerProfile:
     id: str
     name: str
@@ -190,7 +244,7 @@ class PlayerProfile:
     skills: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayersData:
     version: str
     default_player_id: Optional[str]
@@ -200,7 +254,7 @@ class PlayersData:
 # --------------------
 # 경로 번들 (향후 DB 경로로 대체 용이)
 # --------------------
-@dataclass
+@dataclass(slots=True)
 class DataPaths:
     base_dir: Path
     items: Path
@@ -1,23 +1,54 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from math import isqrt
 from typing import List, Tuple
 
 from .entities import Player
 
+# exp_to_next(level) = _EXP_BASE + level * _EXP_PER_LEVEL (gain_exp의 닫힌 형식 계산도 이 값을 쓴다)
+_EXP_BASE = 20
+_EXP_PER_LEVEL = 10
 
+
+@lru_cache(maxsize=256)
 def exp_to_next(level: int) -> int:
     """레벨별 필요 경험치. 간단히 선형 증가."""
-    return 20 + level * 10
+    return _EXP_BASE + level * _EXP_PER_LEVEL
+
+
+def _exp_for_levels(level: int, count: int) -> int:
+    """level에서 count번 레벨업하는 데 필요한 누적 경험치 (등차수열 합)."""
+    return count * exp_to_next(level) + _EXP_PER_LEVEL * count * (count - 1) // 2
+
+
+def _levels_gained(level: int, exp: int) -> int:
+    """exp로 오를 수 있는 레벨 수 k: d*k^2 + (2a + 2dL - d)*k <= 2*exp 의 최대 정수해."""
+    if exp < exp_to_next(level):
+        return 0
+    d = _EXP_PER_LEVEL
+    b = 2 * exp_to_next(level) - d
+    k = (isqrt(b * b + 8 * d * exp) - b) // (2 * d)
+    # isqrt 내림 오차 보정
+    while _exp_for_levels(level, k + 1) <= exp:
+        k += 1
+    while k > 0 and _exp_for_levels(level, k) > exp:
+        k -= 1
+    return k
 
 
 def gain_exp(player: Player, amount: int) -> List[str]:
-    """경험치 획득 및 레벨업 처리."""
+    """경험치 획득 및 레벨업 처리. 여러 레벨을 한 번에 올려도 반복 없이 계산한다."""
     logs: List[str] = []
     player.exp += amount
     logs.append(f"EXP +{amount}")
-    while player.exp >= exp_to_next(player.level):
-        player.exp -= exp_to_next(player.level)
-        player.level += 1
-        player.stat_points += 4
-        logs.append(f"레벨업! Lv {player.level} / 스탯 포인트 +4")
+    gained = _levels_gained(player.level, player.exp)
+    if gained:
+        player.exp -= _exp_for_levels(player.level, gained)
+        player.level += gained
+        player.stat_points += 4 * gained
+        if gained == 1:
+            logs.append(f"레벨업! Lv {player.level} / 스탯 포인트 +4")
+        else:
+            logs.append(f"레벨업 x{gained}! Lv {player.level} / 스탯 포인트 +{4 * gained}")
     return logs
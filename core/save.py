@@ -2,45 +2,148 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, Any
-
-
-DEFAULT_PLAYER_STATE = {
-    "player_state": {
-        "level": 1,
-        "exp": 0,
-        "exp_to_next": 0,
-        "stat_points": 0,
-        "allocated_stats": {},
-        "hp": 0,
-    },
-    "inventory": {"potion_small": 1},
-    "equipment": {"weapon": None, "armor": None, "accessory": None},
-    "dungeon_progress": {
-        "unlocked_zones": ["1"],
-        "unlocked_stage_by_zone": {"1": 1},
-    },
-}
-
-DEFAULT_SAVE = {
-    "selected_player_id": None,
-    "players": {},
-}
+import sys
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+
+import msgpack
+
+try:  # 선택 의존성: 있으면 JSON 세이브 읽기/내보내기를 orjson으로 처리
+    import orjson
+except ImportError:  # pragma: no cover - 표준 json으로 대체
+    orjson = None
+
+
+def _fresh_default_player() -> Dict[str, Any]:
+    """기본 플레이어 슬롯. 호출할 때마다 새 dict를 만들어 깊은 복사가 필요 없다."""
+    return {
+        "player_state": {
+            "level": 1,
+            "exp": 0,
+            "exp_to_next": 0,
+            "stat_points": 0,
+            "allocated_stats": {},
+            "hp": 0,
+        },
+        "inventory": {"potion_small": 1},
+        "equipment": {"weapon": None, "armor": None, "accessory": None},
+        "dungeon_progress": {
+            "unlocked_zones": ["1"],
+            "unlocked_stage_by_zone": {"1": 1},
+        },
+    }
+
+
+def _fresh_default_save() -> Dict[str, Any]:
+    """기본 저장 데이터 (새 dict)."""
+    return {
+        "selected_player_id": None,
+        "players": {},
+    }
+
+
+# 참조용 기본값. 수정해서 쓰지 말고 _fresh_default_* 로 새로 만든다.
+DEFAULT_PLAYER_STATE = _fresh_default_player()
+DEFAULT_SAVE = _fresh_default_save()
+
+
+def _is_json_path(path: str) -> bool:
+    return path.lower().endswith(".json")
+
+
+def _encode(path: str, data: Dict[str, Any]) -> bytes:
+    """확장자로 형식을 고른다: .json은 내보내기용 JSON, 그 외(.bin/.msgpack)는 msgpack."""
+    if not _is_json_path(path):
+        return msgpack.packb(data, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _decode(path: str, buf: bytes) -> Dict[str, Any]:
+    if not _is_json_path(path):
+        return msgpack.unpackb(buf, raw=False)
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
 
 
 def _write(path: str, data: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """경로 확장자에 맞춰 직렬화해 임시 파일에 쓴 뒤 교체한다(쓰기 중 파손 방지)."""
+    _write_bytes(path, _encode(path, data))
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """한 번의 write로 임시 파일에 쓰고 fsync 후 교체 (전원 차단 시에도 이전/새 파일 중 하나는 온전히 남는다)."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class _BackgroundWriter:
+    """직렬화된 저장 데이터를 별도 스레드에서 기록한다.
+
+    대기 슬롯은 하나뿐이라, 기록 중에 새 저장이 들어오면 이전 대기 데이터를 덮어쓴다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Optional[Tuple[str, bytes]] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, path: str, payload: bytes) -> None:
+        with self._lock:
+            self._pending = (path, payload)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+
+    def wait(self) -> None:
+        """진행 중/대기 중인 기록이 끝날 때까지 대기."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                job = self._pending
+                self._pending = None
+                if job is None:
+                    self._thread = None
+                    return
+            try:
+                _write_bytes(*job)
+            except Exception as exc:  # 스레드가 죽으면 _thread가 남아 이후 저장이 묻히므로 모두 잡는다.
+                print(f"[저장 실패] {job[0]}: {exc}")
+
+
+_writer = _BackgroundWriter()
+
+
+def _read(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        return _decode(path, f.read())
+
+
+def _legacy_json_path(save_path: str) -> str:
+    """바이너리 저장 경로에 대응하는 구버전 JSON 저장 경로."""
+    return os.path.splitext(save_path)[0] + ".json"
 
 
 def _ensure_player_slot(save_data: Dict[str, Any], player_id: str) -> Dict[str, Any]:
     """플레이어 슬롯을 보정하고 기본값을 채움."""
     players = save_data.setdefault("players", {})
     if player_id not in players:
-        players[player_id] = json.loads(json.dumps(DEFAULT_PLAYER_STATE))
+        players[player_id] = _fresh_default_player()
     else:
         # 누락 필드 보정
-        merged = json.loads(json.dumps(DEFAULT_PLAYER_STATE))
+        merged = _fresh_default_player()
         merged.update(players[player_id])
         if "player_state" in players[player_id]:
             merged["player_state"].update(players[player_id].get("player_state", {}))
@@ -54,7 +157,7 @@ def _ensure_player_slot(save_data: Dict[str, Any], player_id: str) -> Dict[str,
 
 def _migrate_legacy(loaded: Dict[str, Any], default_player_id: str | None) -> Dict[str, Any]:
     """구버전 저장 구조를 새 구조로 변환."""
-    save_data = json.loads(json.dumps(DEFAULT_SAVE))
+    save_data = _fresh_default_save()
     target_id = loaded.get("selected_player_id") or default_player_id or "char_0"
     if "player" in loaded:
         player_block = loaded.get("player", {})
@@ -77,25 +180,31 @@ def _migrate_legacy(loaded: Dict[str, Any], default_player_id: str | None) -> Di
 
 
 def load_progress(save_path: str, players_data: Dict[str, Any], default_player_id: str | None) -> Dict[str, Any]:
-    """progress.json 로드 및 스키마 보정/마이그레이션."""
+    """progress.bin 로드 및 스키마 보정/마이그레이션.
+
+    바이너리 저장 파일이 없으면 같은 위치의 progress.json을 한 번 읽어 들여 바이너리로 다시 저장한다.
+    save_path 자체가 .json이면 JSON으로 읽고 쓴다. (내보내기/가져오기용)
+    """
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    if not os.path.exists(save_path):
-        data = json.loads(json.dumps(DEFAULT_SAVE))
+    legacy_path = _legacy_json_path(save_path)
+    if os.path.exists(save_path):
+        loaded = _read(save_path)
+    elif legacy_path != save_path and os.path.exists(legacy_path):
+        loaded = _read(legacy_path)
+    else:
+        data = _fresh_default_save()
         data["selected_player_id"] = default_player_id or next(iter(players_data.keys()), "char_0")
         _ensure_player_slot(data, data["selected_player_id"])
         _write(save_path, data)
         return data
 
-    with open(save_path, "r", encoding="utf-8") as f:
-        loaded = json.load(f)
-
     # 구버전 마이그레이션 처리
     if "players" not in loaded:
         migrated = _migrate_legacy(loaded, default_player_id)
         _write(save_path, migrated)
         return migrated
 
-    save_data = json.loads(json.dumps(DEFAULT_SAVE))
+    save_data = _fresh_default_save()
     save_data.update(loaded)
     # 플레이어 슬롯 보정 및 기본 선택 복원
     for pid in players_data.keys():
@@ -112,10 +221,21 @@ def save_progress(save_path: str, data: Dict[str, Any]) -> None:
     _write(save_path, data)
 
 
+def save_progress_async(save_path: str, data: Dict[str, Any]) -> None:
+    """호출 스레드에서 직렬화만 하고 디스크 기록은 백그라운드 스레드에 맡긴다."""
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    _writer.submit(save_path, _encode(save_path, data))
+
+
+def wait_for_pending_writes() -> None:
+    """백그라운드 저장이 모두 끝날 때까지 대기 (앱 종료 시 호출)."""
+    _writer.wait()
+
+
 def _to_inventory_dict(inv) -> Dict[str, int]:
-    """리스트/딕셔너리를 dict[str,int] 형태로 정규화."""
+    """리스트/딕셔너리를 dict[str,int] 형태로 정규화. (아이템 id는 intern)"""
     if isinstance(inv, dict):
-        return { _normalize_item_id(str(k)): int(v) for k, v in inv.items()}
+        return {_normalize_item_id(str(k)): int(v) for k, v in inv.items()}
     if isinstance(inv, list):
         counts: Dict[str, int] = {}
         for item_id in inv:
@@ -125,7 +245,10 @@ def _to_inventory_dict(inv) -> Dict[str, int]:
     return {}
 
 
+# 구버전 아이템 ID → 신규 ID
+_LEGACY_ITEM_IDS = MappingProxyType({sys.intern("minor_potion"): sys.intern("potion_small")})
+
+
 def _normalize_item_id(item_id: str) -> str:
-    """구버전 아이템 ID를 신규 ID로 맵핑."""
-    legacy_map = {"minor_potion": "potion_small"}
-    return legacy_map.get(item_id, item_id)
+    """구버전 아이템 ID를 신규 ID로 맵핑하고 intern한 문자열을 돌려준다."""
+    return _LEGACY_ITEM_IDS.get(item_id) or sys.intern(item_id)
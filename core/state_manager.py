@@ -15,7 +15,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from . import effects, progression
 from .data_manager import DataManager
 from .entities import Player
-from .models import ItemsData, PlayerProgress, PlayersData, SaveData, Stats
+from .models import Equipment, ItemsData, PlayerProgress, PlayersData, SaveData, Stats
 
 
 class GameStateManager(QObject):
@@ -107,9 +107,10 @@ class GameStateManager(QObject):
 
         elif effect.type == "cleanse":
             remove_list = effect.remove or []
-            before_len = len(self.player.effects)
-            self.player.effects = [eff for eff in self.player.effects if getattr(eff, "kind", None) not in remove_list]
-            changed = before_len != len(self.player.effects)
+            kept = [eff for eff in self.player.effects if getattr(eff, "kind", None) not in remove_list]
+            changed = len(kept) != len(self.player.effects)
+            if changed:
+                self.player.set_effects(kept)
 
         elif effect.type == "buff_stats":
             spec = {
@@ -176,6 +177,7 @@ class GameStateManager(QObject):
 
         self.player.stat_points -= spend
         self.player.allocated_stats[stat_key] = self.player.allocated_stats.get(stat_key, 0) + spend
+        self.player.invalidate_stats()
         self.player.sync_hp_to_total(self._items_as_legacy())
         self._sync_progress_from_player()
         max_hp = self.player.get_total_stats(self._items_as_legacy()).max_hp
@@ -220,6 +222,7 @@ class GameStateManager(QObject):
         if inv[item_id] <= 0:
             inv.pop(item_id, None)
         self.player.equipment[slot] = item_id
+        self.player.invalidate_stats()
         self.player.sync_hp_to_total(self._items_as_legacy())
         self._sync_progress_from_player()
         max_hp = self.player.get_total_stats(self._items_as_legacy()).max_hp
@@ -240,6 +243,7 @@ class GameStateManager(QObject):
             return False
         self._add_inventory(current, 1)
         self.player.equipment[slot] = None
+        self.player.invalidate_stats()
         self.player.sync_hp_to_total(self._items_as_legacy())
         self._sync_progress_from_player()
         max_hp = self.player.get_total_stats(self._items_as_legacy()).max_hp
@@ -284,7 +288,7 @@ class GameStateManager(QObject):
             exp_to_next=progress.exp_to_next,
             stat_points=progress.stat_points,
             inventory=dict(progress.inventory),
-            equipment=dict(progress.equipment),
+            equipment=progress.equipment.to_dict(),
             allocated_stats=dict(progress.allocated_stats),
             base_stats=base_stats,
         )
@@ -326,7 +330,7 @@ class GameStateManager(QObject):
         prog.allocated_stats = dict(self.player.allocated_stats)
         prog.hp = self.player.hp
         prog.inventory = dict(self.player.inventory)
-        prog.equipment = dict(self.player.equipment)
+        prog.equipment = Equipment.from_raw(self.player.equipment)
         self.save_data.selected_player_id = self.active_player_id
 
     def _emit_initial_state(self) -> None:
@@ -6,6 +6,7 @@ import re
 from PyQt6 import QtWidgets, QtCore, QtGui
 
 from core.asset_loader import AssetLoader
+from core.combat import LogEntry, render_logs
 from .anim_fx import FloatingText, TurnBanner, shake_widget, flash_widget, animate_hpbar, SkillOverlay
 from .widgets import HPBar, EffectChips
 
@@ -182,7 +183,7 @@ class BattleView(QtWidgets.QWidget):
         self,
         player_hp: tuple[int, int],
         enemy_hp: tuple[int, int],
-        logs: list[str],
+        logs: list[LogEntry],
         player_effects=None,
         enemy_effects=None,
         turn_index: int | None = None,
@@ -214,8 +215,9 @@ class BattleView(QtWidgets.QWidget):
     def set_header(self, text: str) -> None:
         self.status_label.setText(text)
 
-    def _set_logs(self, logs: list[str]) -> None:
-        recent = logs[-80:]
+    def _set_logs(self, logs: list[LogEntry]) -> None:
+        # 화면에 보이는 최근 로그만 문자열로 변환
+        recent = render_logs(logs[-80:])
         lines = []
         for line in recent:
             safe = html.escape(line)
@@ -47,15 +47,14 @@ class _PatchWorker(QThread):
         current = 10
         self.progress.emit(current)
 
-        # 파일마다 다운로드가 끝날 때마다 조금씩 증가시켜 사용자에게 피드백 제공
-        success_all = True
-        for idx, rel_path in enumerate(targets, start=1):
-            # download_updates는 내부에서 안전 쓰기를 하지만, 여기서는 파일 단위 진행률 표시를 위해 하나씩 호출
-            result = self.patcher.download_updates([rel_path])
-            success_all = success_all and result
+        # 목록 전체를 한 번에 넘겨 동시에 내려받고, 파일 하나가 끝날 때마다 조금씩 증가시켜 피드백 제공
+        def on_file_done(rel_path: str, ok: bool) -> None:
+            nonlocal current
             current = min(100, current + step)
             self.progress.emit(current)
 
+        success_all = self.patcher.download_updates(targets, on_file_done=on_file_done)
+
         self.progress.emit(100)
         self.finished_ok.emit(success_all)
 
@@ -189,8 +189,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def refresh_dungeon(self):
         zones = self.controller.data_dungeons.get("zones", {})
-        prog = self.controller.dungeon_progress
-        self.dungeon_view.refresh(zones, prog.unlocked_zones, prog.unlocked_stage_by_zone)
+        prog = self.controller.dungeon_progress.to_dict()
+        self.dungeon_view.refresh(zones, prog["unlocked_zones"], prog["unlocked_stage_by_zone"])
         self._update_hud()
 
     def refresh_inventory(self):